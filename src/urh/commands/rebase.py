@@ -14,7 +14,7 @@ from typing import List, Optional, Tuple
 from ..commands.deployment_helpers import MenuSystemProtocol
 from ..constants import REGISTRY_PREFIXES
 from ..deployment import build_persistent_header
-from ..oci_client import OCIClient
+from ..oci_client import get_client
 from ..system import _run_command, build_command
 
 
@@ -186,7 +186,7 @@ def _resolve_and_build_url(
     skip_confirmation: bool,
 ) -> Optional[str]:
     """Fetch tags, resolve short tag, and build full URL."""
-    client = OCIClient(repository)
+    client = get_client(repository)
     tags_data = client.fetch_repository_tags(f"ghcr.io/{repository}")
 
     if not tags_data or "tags" not in tags_data:
@@ -8,7 +8,7 @@ from typing import List, Optional
 
 from ..commands.deployment_helpers import MenuSystemProtocol
 from ..deployment import build_persistent_header
-from ..oci_client import OCIClient
+from ..oci_client import get_client
 
 
 def _get_url_for_remote_ls(
@@ -54,7 +54,7 @@ def _display_tags_for_url(url: str) -> int:
     repository = extract_repository_from_url(url)
 
     # Create OCI client and fetch tags
-    client = OCIClient(repository)
+    client = get_client(repository)
     tags_data = client.fetch_repository_tags(url)
 
     if tags_data and "tags" in tags_data and tags_data["tags"]:
@@ -20,6 +20,11 @@ def format_menu_separator() -> str:
 DEFAULT_CONFIG_PATH = "~/.config/urh.toml"
 XDG_CONFIG_PATH = "$XDG_CONFIG_HOME/urh.toml"
 CACHE_FILE_PATH = "/tmp/oci_ghcr_token"
+TAGS_CACHE_FILE_NAME = "oci_ghcr_tags.json"  # in $XDG_CACHE_HOME/urh (~/.cache/urh)
+TOKEN_MEMORY_TTL = 55  # seconds a token is reused in-process between cache reads
+PAGE_FETCH_TIMEOUT = 30  # seconds allowed for a single tag-list page request
+TAGS_FETCH_TIMEOUT = 120  # seconds allowed for the whole tag pagination crawl
+FILTERED_TAGS_TTL = 300  # seconds a filtered tag listing is reused in-process
 MAX_TAGS_DISPLAY = 30
 DEFAULT_REGISTRY = "ghcr.io"
 GITHUB_TOKEN_URL = "https://ghcr.io/token"
@@ -6,7 +6,7 @@ import logging
 import os
 import subprocess
 import sys
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from .constants import PYTEST_CURRENT_TEST, URH_AVOID_GUM, URH_TEST_NO_EXCEPTION
 from .models import GumCommand, MenuItem
@@ -47,6 +47,11 @@ class MenuSystem:
         self._input_func = input_func or input
         self._exit_func = exit_func or sys.exit
 
+    @property
+    def _avoid_gum(self) -> bool:
+        """Whether non-gum behavior is forced (e.g., to avoid hanging during tests)."""
+        return os.environ.get(URH_AVOID_GUM, "").lower() in ("1", "true", "yes")
+
     def show_menu(
         self,
         items: Sequence[MenuItem],  # Changed from List[MenuItem] to Sequence[MenuItem]
@@ -55,14 +60,7 @@ class MenuSystem:
         is_main_menu: bool = False,
     ) -> Optional[Any]:
         """Show a menu and return the selected value."""
-        # Check if we should force non-gum behavior (e.g., to avoid hanging during tests)
-        force_non_gum = os.environ.get(URH_AVOID_GUM, "").lower() in (
-            "1",
-            "true",
-            "yes",
-        )
-
-        if not self.is_tty or force_non_gum:
+        if not self.is_tty or self._avoid_gum:
             self._show_non_tty(items, header, persistent_header)
             return None
 
@@ -77,12 +75,11 @@ class MenuSystem:
         self, items: Sequence[MenuItem], header: str, persistent_header: Optional[str]
     ) -> None:
         """Show menu in non-TTY mode."""
-        if persistent_header:
-            print(persistent_header)
-        print(header)
-        for item in items:
-            print(item.display_text)
-        print("\nRun 'urh.py with a specific option.'")
+        lines = [persistent_header] if persistent_header else []
+        lines.append(header)
+        lines.extend(item.display_text for item in items)
+        lines.append("\nRun 'urh.py with a specific option.'")
+        _write_lines(lines)
 
     def _show_gum_menu(
         self,
@@ -185,40 +182,46 @@ class MenuSystem:
         is_main_menu: bool,
     ) -> Optional[Any]:
         """Show menu using plain text."""
-        self._display_text_menu_header(persistent_header, header)
-        self._display_text_menu_items(items)
+        _write_lines(
+            self._text_menu_header_lines(persistent_header, header)
+            + self._text_menu_item_lines(items)
+        )
 
         return self._process_text_menu_input(items, is_main_menu)
 
-    def _display_text_menu_header(
+    def _text_menu_header_lines(
         self, persistent_header: Optional[str], header: str
-    ) -> None:
-        """Display the text menu header."""
-        if persistent_header:
-            print(persistent_header)
-        print(header)
-        print("Press ESC to cancel")
+    ) -> List[str]:
+        """Build the text menu header lines."""
+        lines = [persistent_header] if persistent_header else []
+        lines.append(header)
+        lines.append("Press ESC to cancel")
+        return lines
 
-    def _display_text_menu_items(self, items: Sequence[MenuItem]) -> None:
-        """Display the text menu items."""
-        for i, item in enumerate(items, 1):
-            print(f"{i}. {item.display_text}")
+    def _text_menu_item_lines(self, items: Sequence[MenuItem]) -> List[str]:
+        """Build the numbered text menu item lines."""
+        return [f"{i}. {item.display_text}" for i, item in enumerate(items, 1)]
 
     def _process_text_menu_input(
         self, items: Sequence[MenuItem], is_main_menu: bool
     ) -> Optional[Any]:
         """Process text menu input and return the selected value."""
+        index_map = self._build_choice_index(items)
         while True:
             try:
                 choice = self._get_user_choice()
                 if not choice:
                     return None
 
-                choice_num = self._parse_choice_number(choice, items)
-                return self._handle_valid_choice(choice_num, items)
+                try:
+                    item = index_map.get(int(choice))
+                except ValueError:
+                    item = None
 
-            except ValueError:
+                if item is not None:
+                    return self._handle_valid_choice(item)
                 self._handle_invalid_choice()
+
             except KeyboardInterrupt:
                 return self._handle_keyboard_interrupt(is_main_menu)
 
@@ -226,18 +229,12 @@ class MenuSystem:
         """Get user choice input."""
         return self._input_func("\nEnter choice (number): ").strip()
 
-    def _parse_choice_number(self, choice: str, items: Sequence[MenuItem]) -> int:
-        """Parse and validate the choice number."""
-        choice_num = int(choice)
-        if 1 <= choice_num <= len(items):
-            return choice_num
-        raise ValueError("Invalid choice")
+    def _build_choice_index(self, items: Sequence[MenuItem]) -> Dict[int, MenuItem]:
+        """Map each 1-based choice number to its menu item."""
+        return {i: item for i, item in enumerate(items, 1)}
 
-    def _handle_valid_choice(
-        self, choice_num: int, items: Sequence[MenuItem]
-    ) -> Optional[Any]:
+    def _handle_valid_choice(self, item: MenuItem) -> Optional[Any]:
         """Handle a valid choice and return the appropriate value."""
-        item = items[choice_num - 1]
         if item.key and item.key.strip():
             return item.key
         else:
@@ -255,6 +252,12 @@ class MenuSystem:
             return None
 
 
+def _write_lines(lines: List[str]) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def get_user_input(prompt: str) -> str:
     """Get user input with a prompt.
 
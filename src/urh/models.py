@@ -2,11 +2,12 @@
 Data models for ublue-rebase-helper.
 """
 
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Dict, List, Optional
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class MenuItem:
     """Represents a menu item."""
 
@@ -20,7 +21,7 @@ class MenuItem:
         return f"{self.key} - {self.description}"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ListItem(MenuItem):
     """Represents a list item without key prefix in display."""
 
@@ -30,7 +31,7 @@ class ListItem(MenuItem):
         return self.description
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class GumCommand:
     """Builder for gum choose commands."""
 
@@ -42,22 +43,30 @@ class GumCommand:
     height: int = 10  # Default height, can be increased for more options
     timeout: int = 300  # 5 minute timeout
 
+    _flags: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index flag values by flag name so lookups never scan the argv list."""
+        # Frozen, so the derived flags can never go stale behind the fields
+        object.__setattr__(
+            self,
+            "_flags",
+            {
+                "--cursor": self.cursor,
+                "--selected-prefix": self.selected_prefix,
+                "--height": str(self.height),
+                "--header": self._build_header(),
+            },
+        )
+
     def build(self) -> List[str]:
         """Build the gum command."""
-        cmd = [
+        return [
             "gum",
             "choose",
-            "--cursor",
-            self.cursor,
-            "--selected-prefix",
-            self.selected_prefix,
-            "--height",
-            str(self.height),
-            "--header",
-            self._build_header(),
+            *chain.from_iterable(self._flags.items()),
+            *self.options,
         ]
-        cmd.extend(self.options)
-        return cmd
 
     def _build_header(self) -> str:
         """Build combined header."""
@@ -2,30 +2,183 @@
 OCI client implementation for ublue-rebase-helper.
 """
 
+import functools
 import json
 import logging
+import os
+import re
 import subprocess
-from typing import Any, Dict, List, Optional
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from .config import get_config
+from .constants import (
+    FILTERED_TAGS_TTL,
+    PAGE_FETCH_TIMEOUT,
+    TAGS_CACHE_FILE_NAME,
+    TAGS_FETCH_TIMEOUT,
+)
 from .system import extract_context_from_url
 
+if TYPE_CHECKING:
+    from .token_manager import OCITokenManager
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# One "Name: value" header per line; surrounding whitespace and CR excluded
+# from both groups, so names only need lower-casing
+_HEADER_RE = re.compile(
+    r"^[ \t]*([^:\s]+)[ \t]*:[ \t]*([^\r\n]*?)[ \t]*\r?$", re.MULTILINE
+)
+# Status line, e.g. "HTTP/1.1 401 Unauthorized" or "HTTP/2 200"
+_STATUS_LINE_RE = re.compile(r"HTTP/\d+(?:\.\d+)?\s+(\d{3})\b")
+
+
+def _default_tags_cache_path() -> str:
+    """Get the per-user tag page cache file under $XDG_CACHE_HOME (~/.cache)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "urh", TAGS_CACHE_FILE_NAME)
+
+
+def _is_valid_page_entry(entry: Any) -> bool:
+    """Check a cached tag page has the expected shape and a ghcr.io next URL.
+
+    The etag is sent back verbatim as an If-None-Match header, so it must
+    not contain line breaks.
+    """
+    if not isinstance(entry, dict):
+        return False
+    etag = entry.get("etag")
+    tags = entry.get("tags")
+    next_url = entry.get("next")
+    return (
+        isinstance(etag, str)
+        and "\r" not in etag
+        and "\n" not in etag
+        and isinstance(tags, list)
+        and all(isinstance(tag, str) for tag in tags)
+        and (
+            next_url is None
+            or (
+                isinstance(next_url, str)
+                and (
+                    (next_url.startswith("/") and not next_url.startswith("//"))
+                    or next_url.startswith("https://ghcr.io/")
+                )
+            )
+        )
+    )
+
 
 class OCIClient:
     """A client for OCI Container Registry interactions using curl."""
 
     def __init__(
-        self, repository: str, cache_path: Optional[str] = None, debug: bool = False
+        self,
+        repository: str,
+        cache_path: Optional[str] = None,
+        debug: bool = False,
+        tags_cache_path: Optional[str] = None,
+        token_manager: Optional["OCITokenManager"] = None,
+        subprocess_runner: Optional[Callable] = None,
     ):
+        """
+        Initialize OCIClient with optional dependency injection for testability.
+
+        Args:
+            repository: Repository path, e.g. "ublue-os/bazzite"
+            cache_path: Token cache file (default: CACHE_FILE_PATH)
+            debug: Enable debug behaviour
+            tags_cache_path: Tag page cache file
+                (default: $XDG_CACHE_HOME/urh/TAGS_CACHE_FILE_NAME)
+            token_manager: Token provider (default: OCITokenManager)
+            subprocess_runner: subprocess.run replacement for curl calls
+                (default: subprocess.run)
+        """
         self.repository = repository
         self.debug = debug
         self.config = get_config()
         from .token_manager import OCITokenManager
 
-        self.token_manager = OCITokenManager(repository, cache_path)
+        self.token_manager = token_manager or OCITokenManager(repository, cache_path)
+        # Resolved per call so a patched subprocess.run is still honoured
+        self._subprocess_runner = subprocess_runner
+        self.tags_cache_path = tags_cache_path or _default_tags_cache_path()
+        self._tags_list_url = f"https://ghcr.io/v2/{repository}/tags/list"
+        # Per-page conditional-request cache: url -> {"etag", "tags", "next"}
+        self._page_cache: Dict[str, Dict[str, Any]] = {}
+        self._page_cache_dirty = False
+        # fetch_repository_tags results per context: (tags, monotonic timestamp),
+        # reused for FILTERED_TAGS_TTL seconds
+        self._filtered_tags_cache: Dict[Optional[str], tuple[List[str], float]] = {}
+
+    def _load_page_cache(self) -> None:
+        """Load this repository's cached tag pages from disk.
+
+        Entries with an unexpected shape, or whose next URL leaves ghcr.io,
+        are dropped (and pruned on the next save) rather than trusted.
+        """
+        self._page_cache_dirty = False
+        try:
+            with open(self.tags_cache_path, "r") as f:
+                pages = json.load(f).get(self.repository, {})
+        except (OSError, ValueError, AttributeError):
+            pages = {}
+        if not isinstance(pages, dict):
+            pages = {}
+        self._page_cache = {
+            url: entry for url, entry in pages.items() if _is_valid_page_entry(entry)
+        }
+        self._page_cache_dirty = len(self._page_cache) != len(pages)
+
+    def _save_page_cache(self) -> None:
+        """Atomically persist this repository's tag pages next to other repos'."""
+        if not self._page_cache_dirty:
+            return
+        try:
+            with open(self.tags_cache_path, "r") as f:
+                all_repos = json.load(f)
+            if not isinstance(all_repos, dict):
+                all_repos = {}
+        except (OSError, ValueError):
+            all_repos = {}
+        all_repos[self.repository] = self._page_cache
+
+        cache_dir = os.path.dirname(self.tags_cache_path) or "."
+        tmp_path: Optional[str] = None
+        try:
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(all_repos, f)
+            os.replace(tmp_path, self.tags_cache_path)
+            tmp_path = None
+            self._page_cache_dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write tags cache {self.tags_cache_path}: {e}")
+        finally:
+            # Don't leave the temp file behind if writing or renaming failed
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _prune_page_cache(self, visited_urls: set[str]) -> None:
+        """Forget cached pages the last complete crawl did not visit.
+
+        Cursor URLs (?last=<tag>) change as tags are published, so without
+        this the cache file would keep every cursor ever seen.
+        """
+        stale = self._page_cache.keys() - visited_urls
+        for url in stale:
+            del self._page_cache[url]
+        if stale:
+            self._page_cache_dirty = True
 
     def _validate_token(self) -> Optional[str]:
         """Get and validate authentication token."""
@@ -37,21 +190,25 @@ class OCIClient:
 
     def _normalize_pagination_url(self, url: str) -> str:
         """Normalize pagination URL to full URL format."""
-        if url.startswith("http"):
-            return url
-        elif url.startswith("/"):
+        # Link headers carry root-relative paths, so check that case first
+        if url.startswith("/"):
             return f"https://ghcr.io{url}"
+        elif url.startswith("http"):
+            return url
         else:
             return f"https://ghcr.io/{url}"
 
     def _handle_page_fetch_error(
         self, page_count: int, all_tags: List[str]
     ) -> Optional[Dict[str, Any]]:
-        """Handle page fetch errors and return partial results if available."""
+        """Handle page fetch errors and return partial results if available.
+
+        Partial results carry "complete": False so callers don't cache them.
+        """
         logger.error(f"Failed to fetch page {page_count}")
         if all_tags:
             logger.warning(f"Returning {len(all_tags)} tags collected so far")
-            return {"tags": all_tags}
+            return {"tags": all_tags, "complete": False}
         return None
 
     def _log_pagination_progress(
@@ -65,10 +222,21 @@ class OCIClient:
             )
 
     def get_all_tags(
-        self, context_url: Optional[str] = None
+        self,
+        context_url: Optional[str] = None,
+        tag_predicate: Optional[Callable[[str], bool]] = None,
+        total_timeout: float = TAGS_FETCH_TIMEOUT,
     ) -> Optional[Dict[str, Any]]:
         """
         Get all tags with optimized single-request-per-page approach.
+
+        If tag_predicate is given, only tags it accepts are kept, so unwanted
+        tags (e.g. sha256 signatures) are dropped page by page instead of
+        being held for the whole listing.
+
+        The whole crawl is bounded by total_timeout seconds; each page gets
+        at most what is left of that budget. If a later page fails or the
+        budget runs out, the tags so far are returned with "complete": False.
         """
         # Validate token
         token = self._validate_token()
@@ -76,28 +244,48 @@ class OCIClient:
             return None
 
         # Initialize pagination
-        base_url = f"https://ghcr.io/v2/{self.repository}/tags/list"
-        next_url = f"{base_url}?n=200"
+        next_url = f"{self._tags_list_url}?n=200"
         all_tags: List[str] = []
+        visited_urls: set[str] = set()
         page_count = 0
         max_pages = 1000
+        deadline = time.monotonic() + total_timeout
 
         # Log the specific context if provided, otherwise the repository
         target_name = context_url if context_url else self.repository
         logger.debug(f"Starting pagination for: {target_name}")
 
-        # Pagination loop
+        # Pages with a known ETag are revalidated instead of re-downloaded
+        self._load_page_cache()
+
+        # Pagination loop. GHCR pages with an opaque cursor (?last=<tag>&n=200)
+        # taken from each response's Link header, not a page=N index, and sends
+        # only rel="next" (no rel="last" page count), so the next URL is
+        # unknowable until the current page returns; pages cannot be fetched
+        # speculatively or in parallel.
         while next_url and page_count < max_pages:
             page_count += 1
 
             # Normalize URL
             full_url = self._normalize_pagination_url(next_url)
+            visited_urls.add(full_url)
 
             # Log progress
             logger.debug(f"Page {page_count}: {full_url}")
 
+            # Stop once the overall budget is spent
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"Tag fetch exceeded {total_timeout}s overall timeout")
+                return self._handle_page_fetch_error(page_count, all_tags)
+
             # Fetch page data AND next URL in single request
-            page_data, next_url = self._fetch_page_with_headers(full_url, token)
+            page_data, next_url = self._fetch_page_with_headers(
+                full_url,
+                token,
+                timeout=min(PAGE_FETCH_TIMEOUT, remaining),
+                deadline=deadline,
+            )
 
             # Handle fetch errors
             if not page_data:
@@ -105,6 +293,8 @@ class OCIClient:
 
             # Accumulate tags
             page_tags = page_data.get("tags", [])
+            if page_tags and tag_predicate:
+                page_tags = [tag for tag in page_tags if tag_predicate(tag)]
             if page_tags:
                 all_tags.extend(page_tags)
                 self._log_pagination_progress(page_count, page_tags, all_tags, full_url)
@@ -117,151 +307,225 @@ class OCIClient:
         logger.debug(
             f"Pagination complete: {len(all_tags)} tags across {page_count} pages"
         )
+        self._prune_page_cache(visited_urls)
+        self._save_page_cache()
 
         return {"tags": all_tags}
 
     def fetch_repository_tags(
         self, url: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get filtered and sorted tags for the repository."""
-        # Fix: Pass the url to get_all_tags so the logs reflect the actual endpoint
-        tags_data = self.get_all_tags(context_url=url)
-        if not tags_data:
-            return None
+        """Get filtered and sorted tags for the repository.
 
+        Complete results are memoized per context for FILTERED_TAGS_TTL
+        seconds, so a long menu session still sees newly published tags.
+        Partial listings are never memoized.
+        """
         # Extract context from URL if provided
         context = None
         if url:
             context = extract_context_from_url(url)
 
+        cached = self._filtered_tags_cache.get(context)
+        if cached is not None:
+            tags, fetched_at = cached
+            if time.monotonic() - fetched_at < FILTERED_TAGS_TTL:
+                return {"tags": list(tags)}
+            del self._filtered_tags_cache[context]
+
         # Create tag filter with context
         from .tag_filter import OCITagFilter
 
         tag_filter = OCITagFilter(self.repository, self.config, context)
 
+        # Fix: Pass the url to get_all_tags so the logs reflect the actual endpoint
+        tags_data = self.get_all_tags(
+            context_url=url, tag_predicate=tag_filter.keep_tag
+        )
+        if not tags_data:
+            return None
+
+        # get_all_tags() already dropped every tag keep_tag() rejects
         filtered_tags = tag_filter.filter_and_sort_tags(
-            tags_data["tags"], limit=self.config.settings.max_tags_display
+            tags_data["tags"],
+            limit=self.config.settings.max_tags_display,
+            prefiltered=True,
         )
+        # A truncated listing is shown but not memoized, so the next call retries
+        if tags_data.get("complete", True):
+            self._filtered_tags_cache[context] = (filtered_tags, time.monotonic())
 
-        return {"tags": filtered_tags}
+        return {"tags": list(filtered_tags)}
 
-    def _build_curl_command(self, url: str, token: str) -> List[str]:
+    def _build_curl_command(
+        self, url: str, token: str, if_none_match: Optional[str] = None
+    ) -> List[str]:
         """Build curl command for fetching OCI registry data."""
-        return [
+        cmd = [
             "curl",
             "-s",  # Silent
             "-i",  # Include headers in output
             "--http2",  # Force HTTP/2 if available
+            "--compressed",  # Accept gzip; tag-list JSON compresses well
             "-H",
             f"Authorization: Bearer {token}",
-            url,
         ]
+        if if_none_match:
+            cmd.extend(["-H", f"If-None-Match: {if_none_match}"])
+        cmd.append(url)
+        return cmd
 
+    @staticmethod
     def _parse_http_response(
-        self, stdout: str
+        stdout: bytes,
     ) -> tuple[Optional[str], Optional[str], Optional[Dict[str, str]]]:
         """
         Parse HTTP response into status line, headers, and body.
 
+        The separator search runs on the raw bytes; only the small header block
+        (latin-1) and the body (UTF-8) are decoded.
+
         Returns:
             Tuple of (status_line, body, headers_dict) or (None, None, None) on error
         """
         # Split the response into HTTP status line, headers, and body
         # First, find the index of the double newline that separates headers from body
-        double_crlf_pos = stdout.find("\r\n\r\n")
-        double_lf_pos = stdout.find("\n\n")
+        # A bare \n\n only counts if it comes before the first \r\n\r\n, so bound
+        # that search instead of scanning the whole (possibly large) body for it
+        double_crlf_pos = stdout.find(b"\r\n\r\n")
+        double_lf_pos = stdout.find(
+            b"\n\n", 0, double_crlf_pos if double_crlf_pos != -1 else len(stdout)
+        )
 
-        # Check which separator appears first and use it
-        if double_crlf_pos != -1 and (
-            double_lf_pos == -1 or double_crlf_pos < double_lf_pos
-        ):
-            # Use \r\n\r\n separator (4 characters)
-            double_newline_pos = double_crlf_pos
-            separator_len = 4
-        elif double_lf_pos != -1:
+        if double_lf_pos != -1:
             # Use \n\n separator (2 characters)
             double_newline_pos = double_lf_pos
             separator_len = 2
+        elif double_crlf_pos != -1:
+            # Use \r\n\r\n separator (4 characters)
+            double_newline_pos = double_crlf_pos
+            separator_len = 4
         else:
             logger.error("Could not find header/body separator in response")
-            logger.debug(f"Response content: {repr(stdout)}")
+            logger.debug("Response content: %r", stdout)
             return None, None, None
 
         # Extract headers part (from after status line to separator)
-        headers_and_status = stdout[:double_newline_pos]
-        body = stdout[double_newline_pos + separator_len :]  # Skip the separator
+        # Decode straight from a memoryview so the body is not first copied into
+        # an intermediate bytes slice
+        view = memoryview(stdout)
+        headers_and_status = str(view[:double_newline_pos], "latin-1")
+        body = str(view[double_newline_pos + separator_len :], "utf-8", "replace")
 
         # The first line is the HTTP status line, subsequent lines are headers
-        lines = headers_and_status.splitlines()
-        if not lines:
+        status_end = headers_and_status.find("\n")
+        if status_end == -1:
+            status_end = len(headers_and_status)
+        status_line = headers_and_status[:status_end].rstrip("\r")
+        if not status_line:
             logger.error("Empty response headers")
             return None, None, None
 
-        # First line is status line, rest are headers
-        status_line = lines[0]
-        header_lines = lines[1:]
-
-        # Parse headers (case-insensitive)
-        headers: Dict[str, str] = {}
-        for line in header_lines:
-            if ":" in line:
-                key, value = line.split(":", 1)
-                headers[key.strip().lower()] = value.strip()
+        # Parse headers (case-insensitive) in a single regex pass
+        headers: Dict[str, str] = {
+            name.lower(): value
+            for name, value in _HEADER_RE.findall(headers_and_status, status_end)
+        }
 
         return status_line, body, headers
 
     def _handle_auth_error(
-        self, status_line: str, url: str, token: str
+        self,
+        status_line: str,
+        url: str,
+        token: str,
+        timeout: float = PAGE_FETCH_TIMEOUT,
+        deadline: Optional[float] = None,
     ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
-        """Handle authentication errors by invalidating token and retrying."""
+        """Handle authentication errors by invalidating token and retrying.
+
+        With a crawl deadline (time.monotonic()), the retry only gets what is
+        left of it, and is skipped once it has passed.
+        """
         logger.debug(f"Received {status_line}, invalidating token and retrying...")
         self.token_manager.invalidate_cache()
         new_token = self.token_manager.get_token()
         if new_token:
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    logger.error("Tag fetch timed out before retrying with new token")
+                    return None, None
             logger.debug("Got new token, retrying request...")
-            return self._fetch_page_with_headers(url, new_token)
+            return self._fetch_page_with_headers(url, new_token, timeout, deadline)
         else:
             logger.error("Could not obtain new token after auth error")
             return None, None
 
     def _parse_response_body(self, body: str) -> Optional[Dict[str, Any]]:
         """Parse JSON response body and handle errors."""
-        if not body.strip():
+        stripped_body = body.strip()
+        if not stripped_body:
             logger.debug("Empty response body")
             return None
 
-        logger.debug(f"Response body: {repr(body)}")
+        # Lazy %-formatting: a page body can be large, so only repr() it when
+        # debug logging is actually enabled
+        logger.debug("Response body: %r", body)
 
         # Check if the response is an error response from GHCR
         # GHCR error responses follow the pattern: {"errors":[...]}
-        stripped_body = body.strip()
         if stripped_body.startswith('{"errors":'):
             logger.error(f"GHCR API returned an error: {stripped_body}")
             # This is an error response, not the expected tags response
             # The error suggests authentication/token issue
             return None
 
+        # stdlib json on purpose: the zipapp ships no third-party modules, and a
+        # 200-tag page parses in well under a millisecond
         try:
-            data = json.loads(body)
-            logger.debug(f"Fetched {len(data.get('tags', []))} tags")
-            return data
+            data = json.loads(stripped_body)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in response: {e}")
-            logger.debug(f"Response body that failed to parse: {repr(body)}")
+            logger.debug("Response body that failed to parse: %r", body)
+            return None
+
+        # Callers read data["tags"] straight off the parsed page, so reject any
+        # other shape (including error objects not caught by the prefix check
+        # and a "tags" value that is null or not a list)
+        if (
+            not isinstance(data, dict)
+            or "errors" in data
+            or not isinstance(data.get("tags", []), list)
+        ):
+            logger.error(f"Unexpected response from GHCR: {stripped_body[:200]}")
             return None
 
+        logger.debug("Fetched %d tags", len(data.get("tags", [])))
+        return data
+
     def _fetch_page_with_headers(
-        self, url: str, token: str
+        self,
+        url: str,
+        token: str,
+        timeout: float = PAGE_FETCH_TIMEOUT,
+        deadline: Optional[float] = None,
     ) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Fetch page data AND Link header in a single request.
 
+        deadline is the time.monotonic() by which the whole crawl must end;
+        an auth retry is bounded by it rather than getting a fresh timeout.
+
         Returns:
             Tuple of (page_data, next_url)
         """
         try:
-            cmd = self._build_curl_command(url, token)
-            result = self._execute_curl_command(cmd)
+            cached_page = self._page_cache.get(url)
+            cmd = self._build_curl_command(
+                url, token, cached_page["etag"] if cached_page else None
+            )
+            result = self._execute_curl_command(cmd, timeout)
 
             status_line, body, headers = self._parse_http_response(result.stdout)
             if status_line is None or body is None or headers is None:
@@ -269,9 +533,21 @@ class OCIClient:
 
             logger.debug(f"HTTP Status: {status_line}")
 
-            if auth_result := self._check_auth_error(status_line, url, token):
+            if cached_page and self._is_not_modified(status_line):
+                logger.debug(f"Page not modified, using cached tags: {url}")
+                return {"tags": cached_page["tags"]}, cached_page["next"]
+
+            if auth_result := self._check_auth_error(
+                status_line, url, token, timeout, deadline
+            ):
                 return auth_result
 
+            # Any other 4xx/5xx carries an error document, not tags: skip parsing it
+            status_code = self._status_code(status_line)
+            if status_code is not None and status_code >= 400:
+                logger.error(f"GHCR returned {status_line}: {body[:200]}")
+                return None, None
+
             next_url = self._extract_next_url(headers)
             data = self._parse_response_body(body) if body else None
 
@@ -280,31 +556,68 @@ class OCIClient:
 
             logger.debug(f"Fetched tags, has_next: {next_url is not None}")
 
+            if etag := headers.get("etag"):
+                self._page_cache[url] = {
+                    "etag": etag,
+                    "tags": data.get("tags", []),
+                    "next": next_url,
+                }
+                self._page_cache_dirty = True
+            elif self._page_cache.pop(url, None) is not None:
+                # Without an ETag the old entry can never be revalidated
+                self._page_cache_dirty = True
+
             return data, next_url
 
         except subprocess.TimeoutExpired:
             logger.error(f"Timeout fetching page: {url}")
             return None, None
+        except subprocess.CalledProcessError as e:
+            # curl itself failed (network, DNS, ...); the cached page is still good
+            logger.error(f"curl failed fetching page {url}: exit {e.returncode}")
+            return None, None
         except Exception as e:
             logger.error(f"Error fetching page: {e}")
+            # Never reuse a cached page that broke this fetch
+            if self._page_cache.pop(url, None) is not None:
+                self._page_cache_dirty = True
+                self._save_page_cache()
             return None, None
 
-    def _execute_curl_command(self, cmd: List[str]) -> subprocess.CompletedProcess[str]:
-        """Execute curl command and return result."""
-        return subprocess.run(
+    def _execute_curl_command(
+        self, cmd: List[str], timeout: float = PAGE_FETCH_TIMEOUT
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Execute curl command and return its raw (undecoded) result."""
+        runner = self._subprocess_runner or subprocess.run
+        return runner(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
-            timeout=30,
+            timeout=timeout,
         )
 
+    @staticmethod
+    def _status_code(status_line: str) -> Optional[int]:
+        """Extract the numeric status code from an HTTP status line."""
+        match = _STATUS_LINE_RE.match(status_line)
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _is_not_modified(status_line: str) -> bool:
+        """Check whether the status line is a 304 Not Modified."""
+        return OCIClient._status_code(status_line) == 304
+
     def _check_auth_error(
-        self, status_line: str, url: str, token: str
+        self,
+        status_line: str,
+        url: str,
+        token: str,
+        timeout: float = PAGE_FETCH_TIMEOUT,
+        deadline: Optional[float] = None,
     ) -> Optional[tuple[Optional[Dict[str, Any]], Optional[str]]]:
         """Check for auth errors and handle them."""
-        if status_line and ("401" in status_line or "403" in status_line):
-            return self._handle_auth_error(status_line, url, token)
+        if status_line and self._status_code(status_line) in (401, 403):
+            return self._handle_auth_error(status_line, url, token, timeout, deadline)
         return None
 
     def _extract_next_url(self, headers: Optional[Dict[str, str]]) -> Optional[str]:
@@ -313,3 +626,13 @@ class OCIClient:
         return (
             self.token_manager.parse_link_header(link_header) if link_header else None
         )
+
+
+@functools.lru_cache(maxsize=64)
+def get_client(repository: str, cache_path: Optional[str] = None) -> OCIClient:
+    """Get a shared OCIClient for a repository.
+
+    Repeated lookups reuse the same client, and with it the in-memory token
+    and tag page cache. Prefer this over constructing OCIClient directly.
+    """
+    return OCIClient(repository, cache_path=cache_path)
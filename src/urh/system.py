@@ -4,7 +4,7 @@ System utilities for ublue-rebase-helper.
 
 import logging
 import os
-import subprocess
+import shutil
 from typing import List
 
 from .constants import OSTREE_IMAGE_PREFIX, REGISTRY_PREFIXES
@@ -56,30 +56,25 @@ def _run_command(cmd: List[str]) -> int:
 
 
 def check_curl_presence() -> bool:
-    """Check if curl is available in the system."""
-    try:
-        result = subprocess.run(
-            ["which", "curl"], capture_output=True, text=True, check=False
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if curl is available in the system.
+
+    Searches PATH directly rather than spawning `which`, so no process is forked.
+    """
+    return shutil.which("curl") is not None
 
 
 def extract_repository_from_url(url: str) -> str:
     """Extract the repository name from a container URL."""
+    # partition() stops at the first separator instead of splitting the whole URL
     if url.startswith(REGISTRY_PREFIXES):
-        registry_removed = url.split("/", 1)[1]
-        repo_part = registry_removed.split(":")[0]
-    else:
-        repo_part = url.split(":")[0] if ":" in url else url
-    return repo_part
+        url = url.partition("/")[2]
+    return url.partition(":")[0]
 
 
 def extract_context_from_url(url: str) -> str | None:
     """Extract the tag context from a URL."""
     if ":" in url:
-        url_tag = url.split(":")[-1]
+        url_tag = url.rpartition(":")[2]
         from .deployment import TagContext
 
         if url_tag in TagContext:
@@ -3,6 +3,7 @@ Tag filtering and sorting for ublue-rebase-helper.
 """
 
 import functools
+import heapq
 import re
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -21,6 +22,84 @@ def _get_compiled_pattern(pattern: str) -> re.Pattern[str]:
     return re.compile(pattern)
 
 
+# Backreferences and numbered conditional groups ((?(1)...)) would be
+# renumbered once patterns are joined into one regex
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(\d")
+
+
+@functools.lru_cache(maxsize=32)
+def _get_combined_pattern(patterns: Tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Get a cached regex matching any of the given patterns in a single pass.
+
+    Returns None when the patterns cannot be joined into one alternation, e.g.
+    they use backreferences, numbered conditional groups or global inline
+    flags that are only valid at the start of a pattern.
+    """
+    if not patterns or any(_BACKREFERENCE_RE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        return None
+
+
+# Built-in filters, matched against the lower-cased tag:
+# - sha256-<hash>[.sig|.att|.sbom]: cosign v2.x legacy signatures and v3.x
+#   attestations, SBOMs and bundles
+# - latest.<suffix>: unless the suffix is a date (8+ digits), which is kept
+#   for transformation
+_SIGNATURE_OR_LATEST_RE = re.compile(r"sha256-|latest\.(?!\d{8,}\Z)")
+# Same as above, plus bare SHA256 hashes for repositories that exclude them
+_SIGNATURE_LATEST_OR_HASH_RE = re.compile(
+    r"sha256-|latest\.(?!\d{8,}\Z)|[0-9a-f]{64}\Z"
+)
+
+
+# Deduplication patterns: optionally context-prefixed XX.YYYYMMDD[.SUBVER]
+# and YYYYMMDD[.SUBVER] tags
+_SERIES_VERSION_TAG_RE = re.compile(
+    r"^(?:testing-|stable-|unstable-)?(\d{2})\.(\d{8})(?:\.(\d+))?$"
+)
+_DATE_ONLY_TAG_RE = re.compile(r"^(?:testing-|stable-|unstable-)?(\d{8})(?:\.(\d+))?$")
+
+# Sort key pattern, one pass for all dated tag shapes:
+# [testing-|stable-|unstable-][XX.]YYYYMMDD[.SUBVER]
+_SORTABLE_TAG_RE = re.compile(
+    r"^(?:(testing|stable|unstable)-)?(?:(\d{2})\.)?(\d{8})(?:\.(\d+))?$"
+)
+
+
+# Sized above the largest tag listings seen in practice: a cache smaller than
+# the tag set is evicted in full on every sort and only adds overhead
+@functools.lru_cache(maxsize=65536)
+def _version_sort_key(tag: str) -> VersionSortKey:
+    """Get the sort key for a tag.
+
+    Dated tags sort by (year, month, day, subver, rank), where rank puts
+    context-prefixed tags (10000 + series) above plain ones (series), and
+    date-only tags use series 0. Other tags sort alphabetically below them.
+
+    Cached because the same tags are sorted again for every context
+    (stable/testing/unstable) of a repository.
+    """
+    m = _SORTABLE_TAG_RE.match(tag)
+    if m:
+        prefix, series, date_str, subver = m.groups()
+        rank = int(series) if series else 0
+        if prefix:
+            rank += 10000
+        return (
+            int(date_str[:4]),
+            int(date_str[4:6]),
+            int(date_str[6:8]),
+            int(subver) if subver else 0,
+            rank,
+        )
+
+    # Alphabetical sorting for other tags
+    return (-1, tuple(ord(c) for c in tag))
+
+
 class OCITagFilter:
     """Handles tag filtering and sorting logic."""
 
@@ -31,89 +110,65 @@ class OCITagFilter:
         self.config = config
         self.repo_config = config.repositories.get(repository, RepositoryConfig())
         self.context = context
-
-    def _should_filter_latest_tag(self, tag_lower: str) -> bool:
-        """Handle filtering of latest. tags."""
-        if tag_lower.startswith("latest."):
-            suffix = tag_lower[7:]
-            if not suffix:
-                return True
-            if len(suffix) >= 8 and suffix.isdigit():
-                return False  # Date format, keep for transformation
-            return True  # Non-date format, filter out
-        return False
-
-    def _should_filter_ignore_list(self, tag_lower: str) -> bool:
-        """Check if tag should be filtered based on ignore list."""
-        return tag_lower in [t.lower() for t in self.repo_config.ignore_tags]
+        self._context_prefix = f"{context}-" if context else ""
+
+        # Precompute per-filter lookups so each tag is checked in a single pass
+        self._ignore_tags = frozenset(t.lower() for t in self.repo_config.ignore_tags)
+        self._filter_patterns = tuple(self.repo_config.filter_patterns)
+        self._combined_filter_pattern = _get_combined_pattern(self._filter_patterns)
+        self._transforms = tuple(
+            (_get_compiled_pattern(transform["pattern"]), transform["replacement"])
+            for transform in self.repo_config.transform_patterns
+        )
+        self._builtin_filter_pattern = (
+            _SIGNATURE_OR_LATEST_RE
+            if self.repo_config.include_sha256_tags
+            else _SIGNATURE_LATEST_OR_HASH_RE
+        )
 
     def _should_filter_patterns(self, tag_lower: str) -> bool:
         """Check if tag should be filtered based on filter patterns."""
-        for pattern in self.repo_config.filter_patterns:
+        if self._combined_filter_pattern is not None:
+            return self._combined_filter_pattern.match(tag_lower) is not None
+        for pattern in self._filter_patterns:
             compiled_pattern = _get_compiled_pattern(pattern)
             if compiled_pattern.match(tag_lower):
                 return True
         return False
 
-    def _should_filter_signature_tags(self, tag_lower: str) -> bool:
-        """Check if tag should be filtered as a signature/attestation tag.
-
-        Handles cosign v2.x and v3.x signature and attestation tags:
-        - sha256-<hash>.sig (v2.x legacy signatures)
-        - sha256-<hash>.att (v3.x attestations)
-        - sha256-<hash>.sbom (v3.x SBOMs)
-        - sha256-<hash> (v3.x bundles without suffix)
-        """
-        if not tag_lower.startswith("sha256-"):
-            return False
-        # Filter all sha256- prefixed tags (covers v2.x .sig and v3.x bundles)
-        return True
-
-    def _should_filter_sha256_hashes(self, tag: str) -> bool:
-        """Check if tag should be filtered as a SHA256 hash."""
-        if not self.repo_config.include_sha256_tags:
-            if len(tag) == 64 and all(c in "0123456789abcdefABCDEF" for c in tag):
-                return True
-        return False
-
     def should_filter_tag(self, tag: str) -> bool:
         """Determine if a tag should be filtered out."""
         tag_lower = tag.lower()
+        return (
+            tag_lower in self._ignore_tags
+            or self._builtin_filter_pattern.match(tag_lower) is not None
+            or self._should_filter_patterns(tag_lower)
+        )
 
-        # Check each filter condition in sequence
-        if self._should_filter_latest_tag(tag_lower):
-            return True
-        if self._should_filter_ignore_list(tag_lower):
-            return True
-        if self._should_filter_patterns(tag_lower):
-            return True
-        if self._should_filter_signature_tags(tag_lower):
-            return True
-        if self._should_filter_sha256_hashes(tag):
-            return True
-
-        return False
+    def keep_tag(self, tag: str) -> bool:
+        """Determine if a tag matches the context and passes all filters."""
+        # Cheap context prefix check first
+        if self._context_prefix and not tag.startswith(self._context_prefix):
+            return False
+        return not self.should_filter_tag(tag)
 
     def transform_tag(self, tag: str) -> str:
         """Transform a tag based on repository rules."""
-        for transform in self.repo_config.transform_patterns:
-            pattern = transform["pattern"]
-            replacement = transform["replacement"]
-            compiled_pattern = _get_compiled_pattern(pattern)
+        for compiled_pattern, replacement in self._transforms:
             if compiled_pattern.match(tag):
-                return re.sub(compiled_pattern, replacement, tag)
+                return compiled_pattern.sub(replacement, tag)
         return tag
 
     def filter_and_sort_tags(
-        self, tags: List[str], limit: int = MAX_TAGS_DISPLAY
+        self, tags: List[str], limit: int = MAX_TAGS_DISPLAY, prefiltered: bool = False
     ) -> List[str]:
-        """Filter and sort tags."""
-        # Filter out unwanted tags
-        filtered_tags = [tag for tag in tags if not self.should_filter_tag(tag)]
+        """Filter and sort tags.
 
-        # Apply context-based filtering if a context is specified
-        if self.context:
-            filtered_tags = self._context_filter_tags(filtered_tags, self.context)
+        Pass prefiltered=True when every tag already passed keep_tag(), e.g.
+        as the tag_predicate of OCIClient.get_all_tags(), to skip filtering.
+        """
+        # Filter out unwanted tags
+        filtered_tags = tags if prefiltered else [t for t in tags if self.keep_tag(t)]
 
         # Transform tags
         transformed_tags = [self.transform_tag(tag) for tag in filtered_tags]
@@ -121,149 +176,49 @@ class OCITagFilter:
         # Deduplicate tags
         deduplicated_tags = self._deduplicate_tags_by_version(transformed_tags)
 
-        # Sort tags based on version patterns
-        sorted_tags = self._sort_tags(deduplicated_tags)
-
-        # Return the first N tags
-        return sorted_tags[:limit]
-
-    def _context_filter_tags(self, tags: List[str], context: str) -> List[str]:
-        """Filter tags based on context."""
-        context_prefix = f"{context}-"
-        context_tags = [tag for tag in tags if tag.startswith(context_prefix)]
-
-        return context_tags
+        # Sort tags based on version patterns, keeping only the first N
+        return self._sort_tags(deduplicated_tags, limit)
 
     def _is_prefixed_tag(self, tag: str) -> bool:
         """Check if a tag is prefixed with testing-, stable-, or unstable-."""
         return tag.startswith(("testing-", "stable-", "unstable-"))
 
-    def _create_version_key_from_match(
-        self,
-        match,
-        series_group: int = 1,
-        date_group: int = 2,
-        subver_group: Optional[int] = 3,
-    ) -> Tuple[str, str, str]:
-        """Create version key from regex match with flexible group positions."""
-        series = match.group(series_group) or ""
-        date = match.group(date_group)
-        subver = (
-            match.group(subver_group) or "0"
-            if subver_group and match.group(subver_group)
-            else "0"
-        )
-        return (series, date, subver)
-
-    def _handle_version_tag_deduplication(
-        self, tag: str, version_key: Tuple[str, str, str], version_map: Dict
-    ) -> None:
-        """Handle deduplication logic for version tags."""
-        is_prefixed = self._is_prefixed_tag(tag)
-
-        # If this version is not in the map, add it
-        # OR if this tag is prefixed and currently stored is not prefixed, replace it
-        # But don't replace an existing prefixed tag with another prefixed tag
-        if version_key not in version_map:
-            version_map[version_key] = tag
-        elif is_prefixed and not self._is_prefixed_tag(version_map[version_key]):
-            # Replace non-prefixed with prefixed
-            version_map[version_key] = tag
-        # Otherwise, keep the existing one (whether prefixed or not)
-
-    def _handle_date_only_tag_deduplication(self, tag: str, version_map: Dict) -> bool:
-        """Handle deduplication logic for date-only tags."""
-        date_only_match = re.match(
-            r"^(?:testing-|stable-|unstable-)?(\d{8})(?:\.(\d+))?$", tag
-        )
-        if date_only_match:
-            # Date-only format: no series (empty string), date, subver
-            version_key = self._create_version_key_from_match(
-                date_only_match, series_group=1, date_group=2, subver_group=2
-            )
-
-            is_prefixed = self._is_prefixed_tag(tag)
-
-            # Use the same logic for storing
-            if version_key not in version_map:
-                version_map[version_key] = tag
-            elif is_prefixed and not self._is_prefixed_tag(version_map[version_key]):
-                # Replace non-prefixed with prefixed
-                version_map[version_key] = tag
-            return True  # Tag was handled
-        return False  # Tag was not handled
-
     def _deduplicate_tags_by_version(self, tags: List[str]) -> List[str]:
         """Deduplicate tags by version, preferring prefixed versions when available."""
-        version_map: Dict[Union[Tuple[str, str, str], str], str] = {}
+        version_map: Dict[Union[Tuple[Optional[str], ...], str], str] = {}
 
         for tag in tags:
             # Try more specific pattern first: prefixed with series number
-            version_match = re.match(
-                r"^(?:testing-|stable-|unstable-)?(\d{2})\.(\d{8})(?:\.(\d+))?$", tag
-            )
-
-            if version_match:
-                # Handle version tags
-                version_key = self._create_version_key_from_match(version_match)
-                self._handle_version_tag_deduplication(tag, version_key, version_map)
-            elif self._handle_date_only_tag_deduplication(tag, version_map):
-                # Date-only tag was handled, continue to next tag
-                continue
+            if version_match := _SERIES_VERSION_TAG_RE.match(tag):
+                series, date, subver = version_match.groups()
+                version_key: Tuple[Optional[str], ...] = (series, date, subver or "0")
+            elif date_only_match := _DATE_ONLY_TAG_RE.match(tag):
+                # No series; a missing subver is kept as None, so YYYYMMDD and
+                # YYYYMMDD.0 stay distinct versions
+                date, subver = date_only_match.groups()
+                version_key = ("", date, subver)
             else:
                 # For non-version tags, just add them directly
                 version_map[tag] = tag
+                continue
+
+            # Keep the first tag seen for a version, unless a prefixed tag
+            # later replaces a non-prefixed one
+            current = version_map.get(version_key)
+            if current is None or (
+                self._is_prefixed_tag(tag) and not self._is_prefixed_tag(current)
+            ):
+                version_map[version_key] = tag
 
         return list(version_map.values())
 
-    def _sort_tags(self, tags: List[str]) -> List[str]:
-        """Sort tags based on version patterns."""
-
-        def _extract_date_parts(
-            match, date_group: int, subver_group: Optional[int] = None
-        ) -> tuple[int, int, int, int]:
-            """Extract (year, month, day, subver) from a regex match."""
-            date_str = match.group(date_group)
-            year = int(date_str[:4])
-            month = int(date_str[4:6])
-            day = int(date_str[6:8])
-            subver = (
-                int(match.group(subver_group))
-                if subver_group and match.group(subver_group)
-                else 0
-            )
-            return (year, month, day, subver)
-
-        def version_key(tag: str) -> VersionSortKey:
-            # Context-prefixed version tags (testing-XX.YYYYMMDD.SUBVER)
-            m = re.match(
-                r"^(testing|stable|unstable)-(\d{2})\.(\d{8})(?:\.(\d+))?$", tag
-            )
-            if m:
-                year, month, day, subver = _extract_date_parts(m, 3, 4)
-                series = int(m.group(2))
-                return (year, month, day, subver, 10000 + series)
-
-            # Context-prefixed date-only tags (testing-YYYYMMDD.SUBVER)
-            m = re.match(r"^(testing|stable|unstable)-(\d{8})(?:\.(\d+))?$", tag)
-            if m:
-                year, month, day, subver = _extract_date_parts(m, 2, 3)
-                return (year, month, day, subver, 10000)
-
-            # Version format tags (XX.YYYYMMDD.SUBVER)
-            m = re.match(r"^(\d{2})\.(\d{8})(?:\.(\d+))?$", tag)
-            if m:
-                year, month, day, subver = _extract_date_parts(m, 2, 3)
-                series = int(m.group(1))
-                return (year, month, day, subver, series)
-
-            # Date format tags (YYYYMMDD.SUBVER)
-            m = re.match(r"^(\d{8})(?:\.(\d+))?$", tag)
-            if m:
-                year, month, day, subver = _extract_date_parts(m, 1, 2)
-                return (year, month, day, subver, 0)
-
-            # Alphabetical sorting for other tags
-            return (-1, tuple(ord(c) for c in tag))
-
-        return sorted(tags, key=version_key, reverse=True)
+    def _sort_tags(self, tags: List[str], limit: Optional[int] = None) -> List[str]:
+        """Sort tags based on version patterns, newest first.
+
+        With a limit smaller than the tag count only the top entries are
+        selected (heapq.nlargest, same order as a full sort then slice).
+        """
+        if limit is not None and 0 <= limit < len(tags):
+            return heapq.nlargest(limit, tags, key=_version_sort_key)
+        sorted_tags = sorted(tags, key=_version_sort_key, reverse=True)
+        return sorted_tags if limit is None else sorted_tags[:limit]
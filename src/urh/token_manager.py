@@ -7,13 +7,19 @@ import logging
 import os
 import re
 import subprocess
+import tempfile
+import time
 from typing import Optional
 
-from .constants import CACHE_FILE_PATH
+from .constants import CACHE_FILE_PATH, TOKEN_MEMORY_TTL
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Matches the "next" entry of a Link header: </v2/...>; rel="next"
+# Tolerates whitespace around the URL, "=", ";" and either quote style
+_LINK_NEXT_RE = re.compile(r'<\s*([^>]+?)\s*>\s*;\s*rel\s*=\s*["\']next["\']')
+
 
 class OCITokenManager:
     """Manages OAuth2 tokens for OCI registries using curl."""
@@ -21,6 +27,8 @@ class OCITokenManager:
     def __init__(self, repository: str, cache_path: Optional[str] = None):
         self.repository = repository
         self.cache_path = cache_path or CACHE_FILE_PATH
+        # In-process copy of the last good token: (token, monotonic timestamp)
+        self._memory_token: Optional[tuple[str, float]] = None
 
     def _get_cache_filepath(self) -> str:
         """Get the full path to the cache file."""
@@ -29,12 +37,33 @@ class OCITokenManager:
     def _cache_token(self, token: str) -> None:
         """Cache the token to the cache file."""
         cache_filepath = self._get_cache_filepath()
+        # Write to a temp file and rename it over the cache so a concurrent
+        # reader never sees a partially written token
+        cache_dir = os.path.dirname(cache_filepath) or "."
+        tmp_path: Optional[str] = None
         try:
-            with open(cache_filepath, "w") as f:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
                 f.write(token)
+            os.replace(tmp_path, cache_filepath)
+            tmp_path = None
             logger.debug(f"Successfully cached new token to {cache_filepath}")
         except (IOError, OSError) as e:
             logger.debug(f"Could not write token to cache {cache_filepath}: {e}")
+        finally:
+            # Never leave a stray copy of the token behind if the rename failed
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _remember_token(self, token: str) -> str:
+        """Keep the token in memory so repeat lookups skip the cache file."""
+        self._memory_token = (token, time.monotonic())
+        return token
 
     def get_token(self) -> Optional[str]:
         """
@@ -43,16 +72,24 @@ class OCITokenManager:
         Returns:
             The token string if successful, None otherwise.
         """
+        # 0. Reuse a recently seen token without touching the filesystem
+        if self._memory_token is not None:
+            token, seen_at = self._memory_token
+            if time.monotonic() - seen_at < TOKEN_MEMORY_TTL:
+                return token
+            self._memory_token = None
+
         cache_filepath = self._get_cache_filepath()
 
-        # 1. Check for a cached token
-        if os.path.exists(cache_filepath):
-            try:
-                with open(cache_filepath, "r") as f:
-                    logger.debug(f"Found cached token at {cache_filepath}")
-                    return f.read().strip()
-            except (IOError, OSError) as e:
-                logger.warning(f"Could not read cached token at {cache_filepath}: {e}")
+        # 1. Check for a cached token (open directly; no separate exists() stat)
+        try:
+            with open(cache_filepath, "r") as f:
+                logger.debug(f"Found cached token at {cache_filepath}")
+                return self._remember_token(f.read().strip())
+        except FileNotFoundError:
+            pass
+        except (IOError, OSError) as e:
+            logger.warning(f"Could not read cached token at {cache_filepath}: {e}")
 
         # 2. If no cache, fetch a new token
         logger.debug("No valid cached token found. Fetching a new one...")
@@ -79,7 +116,7 @@ class OCITokenManager:
             if token:
                 # 3. Cache the new token for future use
                 self._cache_token(token)
-                return token
+                return self._remember_token(token)
             return None
         except Exception as e:
             logger.error(f"Error getting token: {e}")
@@ -88,6 +125,7 @@ class OCITokenManager:
 
     def invalidate_cache(self) -> None:
         """Deletes the cached token file if it exists."""
+        self._memory_token = None
         cache_filepath = self._get_cache_filepath()
         try:
             os.remove(cache_filepath)
@@ -110,13 +148,5 @@ class OCITokenManager:
         if not link_header:
             return None
 
-        # Look for the next link in the Link header
-        # Pattern: </v2/...>; rel="next" or similar variations with spaces
-        # Using a comprehensive pattern to match various formats
-        # This pattern handles: '<url>; rel="next"' including possible spaces
-        next_match = re.search(
-            r'<\s*([^>]+?)\s*>\s*;\s*rel\s*=\s*["\']next["\']', link_header
-        )
-        if next_match:
-            return next_match.group(1)
-        return None
+        next_match = _LINK_NEXT_RE.search(link_header)
+        return next_match.group(1) if next_match else None
@@ -7,6 +7,7 @@ This module provides session, module, and function-scoped fixtures for:
 - Dependency injection helpers for testable source code
 """
 
+import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Callable, Dict, Generator, List, Optional
@@ -210,7 +211,7 @@ def command_registry() -> CommandRegistry:
 
 
 @pytest.fixture(scope="module")
-def mock_config_for_module_tests(mocker: MockerFixture) -> URHConfig:
+def mock_config_for_module_tests() -> URHConfig:
     """
     Create a mock URHConfig for module-level tests.
 
@@ -228,55 +229,76 @@ def mock_config_for_module_tests(mocker: MockerFixture) -> URHConfig:
 
 
 @pytest.fixture(scope="module")
-def oci_client_with_mocks(mocker: MockerFixture) -> Any:
+def menu_system_with_mocks(mocker: MockerFixture) -> Any:
+    """
+    MenuSystem with mocked gum and subprocess.
+
+    Use this for integration tests that need menu interactions without TTY.
+    """
+    from src.urh.menu import MenuSystem
+
+    # Force non-TTY mode to avoid gum
+    mocker.patch("os.isatty", return_value=False)
+
+    return MenuSystem()
+
+
+# =============================================================================
+# FUNCTION-SCOPED FIXTURES (isolated per-test)
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache() -> Generator[None, None, None]:
+    """
+    Clear get_client's per-repository OCIClient cache around every test.
+
+    Keeps a client (and its token and tag caches) built in one test from
+    leaking into the next.
+    """
+    from src.urh.oci_client import get_client
+
+    get_client.cache_clear()
+    yield
+    get_client.cache_clear()
+
+
+@pytest.fixture
+def oci_client_with_mocks(mocker: MockerFixture, tmp_path: Path) -> Any:
     """
     OCIClient with mocked token manager and HTTP client.
 
     Use this for integration tests that need OCIClient without network calls.
+    Its tag page cache lives in tmp_path, never the user's real one.
     """
     from src.urh.oci_client import OCIClient
 
     # Mock token manager
     mock_token_manager = mocker.MagicMock()
     mock_token_manager.get_token.return_value = "test_token"
-    mock_token_manager.invalidate_cache = mocker.MagicMock()
+    mock_token_manager.parse_link_header.return_value = None
 
-    # Create client and inject mock
-    client = OCIClient("test/repo")
-    client.token_manager = mock_token_manager
+    # Create client with the mock injected
+    client = OCIClient(
+        "test/repo",
+        tags_cache_path=str(tmp_path / "tags.json"),
+        token_manager=mock_token_manager,
+    )
 
-    # Mock subprocess for curl calls
+    # Mock subprocess for curl calls (raw HTTP response, as curl -i returns it)
     mocker.patch(
         "subprocess.run",
-        return_value=mocker.MagicMock(
+        return_value=subprocess.CompletedProcess(
+            args=[],
             returncode=0,
-            stdout='{"tags": ["tag1", "tag2", "tag3"]}',
+            stdout=b'HTTP/2 200\r\n\r\n{"tags": ["tag1", "tag2", "tag3"]}',
+            stderr=b"",
         ),
     )
 
     return client
 
 
-@pytest.fixture(scope="module")
-def menu_system_with_mocks(mocker: MockerFixture) -> Any:
-    """
-    MenuSystem with mocked gum and subprocess.
-
-    Use this for integration tests that need menu interactions without TTY.
-    """
-    from src.urh.menu import MenuSystem
-
-    # Force non-TTY mode to avoid gum
-    mocker.patch("os.isatty", return_value=False)
-
-    return MenuSystem()
-
-
-# =============================================================================
-# FUNCTION-SCOPED FIXTURES (isolated per-test)
-# =============================================================================
-
-
 @pytest.fixture
 def mock_rpm_ostree_commands(mocker: MockerFixture) -> None:
     """
@@ -291,34 +313,26 @@ def mock_rpm_ostree_commands(mocker: MockerFixture) -> None:
     """
 
     def mock_subprocess_handler(cmd: list, **kwargs: Any) -> Any:
-        mock_result = mocker.MagicMock()
-        mock_result.returncode = 0
+        returncode, stdout, stderr = 0, "", ""
 
         if "curl" in cmd:
-            if cmd[0] in ("which", "type", "command"):
-                mock_result.stdout = "/usr/bin/curl"
-            else:
-                mock_result.stdout = ""
+            pass
         elif "rpm-ostree" in cmd and "status" in cmd:
-            mock_result.stdout = """State: idle
+            stdout = """State: idle
 Deployments:
 ● ostree-image-signed:docker://ghcr.io/test/repo:testing
                Version: 1.0.0
                 Commit: abc123
 """
         elif "rpm-ostree" in cmd and "kargs" in cmd and "sudo" not in cmd:
-            mock_result.stdout = "quiet loglevel=3"
-        elif "ostree" in cmd and "admin" in cmd and "pin" in cmd:
-            mock_result.stdout = ""
-        elif "ostree" in cmd and "admin" in cmd and "undeploy" in cmd:
-            mock_result.stdout = ""
+            stdout = "quiet loglevel=3"
         elif "rpm-ostree" in cmd or "ostree" in cmd:
-            mock_result.stdout = ""
+            pass
         else:
-            mock_result.returncode = 1
-            mock_result.stderr = f"Unmocked command: {' '.join(cmd)}"
+            returncode = 1
+            stderr = f"Unmocked command: {' '.join(cmd)}"
 
-        return mock_result
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
 
     mocker.patch("subprocess.run", side_effect=mock_subprocess_handler)
 
@@ -372,39 +386,32 @@ def apply_e2e_test_environment(
     """
 
     def _mock_subprocess(cmd: list, **kwargs: Any) -> Any:
-        result = mocker.MagicMock()
-        result.returncode = 0
+        returncode, stdout, stderr = 0, "", ""
         if "curl" in cmd:
-            result.stdout = (
-                "/usr/bin/curl" if cmd[0] in ("which", "type", "command") else ""
-            )
+            pass
         elif "rpm-ostree" in cmd and "status" in cmd:
-            result.stdout = """State: idle
+            stdout = """State: idle
 Deployments:
 ● ostree-image-signed:docker://ghcr.io/test/repo:testing
                Version: 1.0.0
                 Commit: abc123
 """
         elif "rpm-ostree" in cmd and "kargs" in cmd and "sudo" not in cmd:
-            result.stdout = "quiet loglevel=3"
-        elif "ostree" in cmd and "admin" in cmd and "pin" in cmd:
-            result.stdout = ""
-        elif "ostree" in cmd and "admin" in cmd and "undeploy" in cmd:
-            result.stdout = ""
+            stdout = "quiet loglevel=3"
         elif "rpm-ostree" in cmd or "ostree" in cmd:
-            result.stdout = ""
+            pass
         else:
-            result.returncode = 1
-            result.stderr = f"Unmocked command: {' '.join(cmd)}"
-        return result
+            returncode = 1
+            stderr = f"Unmocked command: {' '.join(cmd)}"
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
 
     mocker.patch("subprocess.run", side_effect=_mock_subprocess)
 
     # Mock TTY mode
     mocker.patch("os.isatty", return_value=tty)
 
-    # Mock curl check to always succeed
-    mocker.patch("src.urh.system.check_curl_presence", return_value=True)
+    # Mock curl check to always succeed; cli binds the name at import time
+    mocker.patch("src.urh.cli.check_curl_presence", return_value=True)
 
     # Mock deployment info
     if deployment_info is None:
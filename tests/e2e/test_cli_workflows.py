@@ -280,7 +280,7 @@ class TestCLIArgumentParsing:
 
         result = cli_main()
 
-        mock_print.assert_any_call("Invalid deployment number: not-a-number")
+        mock_print.assert_called_once_with("Invalid deployment number: not-a-number")
         assert result == 1
 
     def test_remote_ls_command_with_url(
@@ -288,7 +288,7 @@ class TestCLIArgumentParsing:
     ) -> None:
         """Test remote-ls command with URL argument."""
         # Mock OCIClient
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": ["v1.0", "v2.0", "v3.0"]
@@ -165,7 +165,7 @@ class TestSubmenuNavigation:
         mocker.patch("src.urh.config.get_config", return_value=mock_config)
 
         # Mock OCIClient for tag fetching
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0", "v2.0"]}
         mock_client_class.return_value = mock_client
@@ -175,6 +175,7 @@ class TestSubmenuNavigation:
 
         # Verify menu was called for submenu
         assert mock_menu_show.call_count >= 2
+        mock_client_class.assert_called_once_with("test/repo")
 
     def test_esc_in_submenu_returns_to_main_menu(self, mocker: MockerFixture) -> None:
         """Test that pressing ESC in submenu returns to main menu."""
@@ -522,23 +523,3 @@ class TestMenuHeaderDisplay:
             call_kwargs = call[1] if len(call) > 1 else {}
             if "persistent_header" in call_kwargs:
                 assert "bazzite-nix" in call_kwargs["persistent_header"]
-
-    def test_esc_in_submenu_returns_to_main_menu(self, mocker: MockerFixture) -> None:
-        """Test that pressing ESC in submenu returns to main menu."""
-        mock_menu_show = mocker.patch("src.urh.menu.MenuSystem.show_menu")
-
-        # First call (main menu) returns "rebase"
-        # Second call (rebase submenu) raises ESC
-        # Third call (back to main menu) returns "check"
-        mock_menu_show.side_effect = [
-            "rebase",  # Main menu selection
-            MenuExitException(is_main_menu=False),  # ESC in submenu
-            "check",  # Back to main menu, select check
-        ]
-
-        sys.argv = ["urh"]
-        with pytest.raises(ExecCompleted):
-            cli_main()
-
-        # Verify menu was shown at least twice (main menu -> submenu, then main menu again)
-        assert mock_menu_show.call_count >= 2
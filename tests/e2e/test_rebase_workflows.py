@@ -130,7 +130,7 @@ class TestRebaseTagResolution:
         """Test rebase with short tag 'foo' resolves to latest foo release."""
 
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -179,7 +179,7 @@ class TestRebaseTagResolution:
         """Test rebase with ambiguous tag shows all matching tags in confirmation."""
 
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -234,7 +234,7 @@ class TestRebaseTagResolution:
     ) -> None:
         """Test rebase with short tag that has no matches shows error."""
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -251,7 +251,9 @@ class TestRebaseTagResolution:
         result = cli_main()
 
         # Verify error message
-        mock_print.assert_any_call("Error: No tags found matching 'nonexistent'")
+        mock_print.assert_called_once_with(
+            "Error: No tags found matching 'nonexistent'"
+        )
 
         # Verify exit with error
         assert result == 1
@@ -354,7 +356,7 @@ class TestRebaseRepoSuffix:
         """Test rebase with repo suffix like 'bazzite-nix-nvidia-open:testing'."""
 
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -398,7 +400,7 @@ class TestRebaseRepoSuffix:
         """Test rebase with repo suffix and short tag that needs resolution."""
 
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -441,7 +443,7 @@ class TestRebaseRepoSuffix:
         """Test rebase with repo suffix and full tag (no resolution needed)."""
 
         # Mock OCIClient - should NOT be called since we have a full tag
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
 
         mock_popen = mocker.patch("subprocess.Popen")
         mock_popen.return_value = _make_mock_process(mocker, returncode=0)
@@ -472,7 +474,7 @@ class TestRebaseRepoSuffix:
         """Test rebase with repo suffix and -y flag skips confirmation."""
 
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -506,7 +508,7 @@ class TestRebaseRepoSuffix:
     ) -> None:
         """Test rebase with repo suffix and tag that has no matches."""
         # Mock OCIClient to fetch tags
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
@@ -523,7 +525,9 @@ class TestRebaseRepoSuffix:
         result = cli_main()
 
         # Verify error message
-        mock_print.assert_any_call("Error: No tags found matching 'nonexistent'")
+        mock_print.assert_called_once_with(
+            "Error: No tags found matching 'nonexistent'"
+        )
 
         # Verify exit with error
         assert result == 1
@@ -857,7 +861,7 @@ class TestRebaseCustomRepository:
         mocker.patch("src.urh.config.get_config", return_value=mock_config)
 
         # Mock OCIClient to fetch tags for the explicit repo
-        mock_client_class = mocker.patch("src.urh.commands.rebase.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.rebase.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": [
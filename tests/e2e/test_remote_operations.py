@@ -8,6 +8,7 @@ Note: Tag filtering/sorting logic is tested in integration tests.
 These E2E tests focus on command workflows and error handling.
 """
 
+import subprocess
 import sys
 
 import pytest
@@ -31,12 +32,14 @@ class TestRemoteLsCommand:
         )
         # Mock subprocess for curl calls
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = mocker.MagicMock(returncode=0, stdout="")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
 
     def test_remote_ls_with_url_argument(self, mocker: MockerFixture) -> None:
         """Test remote-ls command with explicit URL argument."""
         # Mock OCIClient
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {
             "tags": ["v1.0.0", "v1.1.0", "v2.0.0"]
@@ -63,7 +66,7 @@ class TestRemoteLsCommand:
         mock_config.container_urls.options = ["ghcr.io/test/repo:stable"]
         mocker.patch("src.urh.config.get_config", return_value=mock_config)
 
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -81,7 +84,7 @@ class TestRemoteLsCommand:
 
     def test_remote_ls_no_tags_found(self, mocker: MockerFixture) -> None:
         """Test remote-ls when no tags are found."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": []}
         mock_client_class.return_value = mock_client
@@ -92,11 +95,11 @@ class TestRemoteLsCommand:
         cli_main()
 
         # Verify "no tags" message
-        mock_print.assert_any_call("No tags found for ghcr.io/test/repo:tag")
+        mock_print.assert_called_once_with("No tags found for ghcr.io/test/repo:tag")
 
     def test_remote_ls_error_fetching_tags(self, mocker: MockerFixture) -> None:
         """Test remote-ls when tag fetching fails."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = None  # Error case
         mock_client_class.return_value = mock_client
@@ -107,11 +110,13 @@ class TestRemoteLsCommand:
         cli_main()
 
         # Verify error message
-        mock_print.assert_any_call("Could not fetch tags for ghcr.io/test/repo:tag")
+        mock_print.assert_called_once_with(
+            "Could not fetch tags for ghcr.io/test/repo:tag"
+        )
 
     def test_remote_ls_exits_with_success(self, mocker: MockerFixture) -> None:
         """Test remote-ls exits with code 0 on success."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -123,7 +128,7 @@ class TestRemoteLsCommand:
 
     def test_remote_ls_exits_with_error_on_failure(self, mocker: MockerFixture) -> None:
         """Test remote-ls exits with code 1 on failure."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = None
         mock_client_class.return_value = mock_client
@@ -149,7 +154,7 @@ class TestOCIClientIntegration:
 
     def test_oci_client_created_with_repository(self, mocker: MockerFixture) -> None:
         """Test that OCIClient is created with extracted repository name."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -162,7 +167,7 @@ class TestOCIClientIntegration:
 
     def test_fetch_repository_tags_called_with_url(self, mocker: MockerFixture) -> None:
         """Test that fetch_repository_tags is called with the full URL."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -197,7 +202,7 @@ class TestTokenManagerIntegration:
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager_class.return_value = mock_token_manager
 
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -493,7 +493,7 @@ class TestRemoteLsCommand:
 
     def test_remote_ls_with_url_argument(self, mocker: MockerFixture) -> None:
         """Test remote-ls command with URL argument."""
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -521,7 +521,7 @@ class TestRemoteLsCommand:
             "src.urh.deployment.format_menu_header", return_value="Test Header"
         )
 
-        mock_client_class = mocker.patch("src.urh.commands.remote_ls.OCIClient")
+        mock_client_class = mocker.patch("src.urh.commands.remote_ls.get_client")
         mock_client = mocker.MagicMock()
         mock_client.fetch_repository_tags.return_value = {"tags": ["v1.0.0"]}
         mock_client_class.return_value = mock_client
@@ -12,6 +12,7 @@ These tests focus on module-level integration between deployment parsing,
 menu generation, and their dependencies.
 """
 
+import subprocess
 from typing import List
 
 import pytest
@@ -196,24 +197,25 @@ class TestGetDeploymentInfo:
     """Test get_deployment_info function (subprocess integration)."""
 
     @pytest.fixture(autouse=True)
-    def setup_deployment_mocks(
-        self, mocker: MockerFixture, mock_rpm_ostree_commands
-    ) -> None:
+    def setup_deployment_mocks(self, mock_rpm_ostree_commands) -> None:
         """Setup mocks for deployment info tests."""
         # Mock rpm-ostree and ostree commands to prevent FileNotFoundError
 
     def test_get_deployment_info_calls_rpm_ostree(self, mocker: MockerFixture) -> None:
         """Test that get_deployment_info calls rpm-ostree status -v."""
-        mock_result = mocker.MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = """State: idle
+        mock_result = subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout="""State: idle
 Deployments:
 ● ostree-image-signed:docker://ghcr.io/test/repo:testing
                    Digest: sha256:abc123
                   Version: 1.0
                    Commit: abc123
                     OSName: bazzite
-"""
+""",
+            stderr="",
+        )
         mocker.patch("subprocess.run", return_value=mock_result)
 
         deployments = get_deployment_info()
@@ -225,9 +227,9 @@ Deployments:
         self, mocker: MockerFixture
     ) -> None:
         """Test that get_deployment_info handles empty output."""
-        mock_result = mocker.MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "State: idle\nDeployments:\n"
+        mock_result = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="State: idle\nDeployments:\n", stderr=""
+        )
         mocker.patch("subprocess.run", return_value=mock_result)
 
         deployments = get_deployment_info()
@@ -238,9 +240,9 @@ Deployments:
         self, mocker: MockerFixture
     ) -> None:
         """Test that get_deployment_info handles error return code."""
-        mock_result = mocker.MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "rpm-ostree not found"
+        mock_result = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout="", stderr="rpm-ostree not found"
+        )
         mocker.patch("subprocess.run", return_value=mock_result)
 
         deployments = get_deployment_info()
@@ -62,12 +62,7 @@ class TestGumCommand:
 
         cmd = gum_cmd.build()
 
-        # Find the header argument
-        header_index = cmd.index("--header")
-        header_value = cmd[header_index + 1]
-
-        assert "Persistent Header" in header_value
-        assert "Main Header" in header_value
+        assert cmd[cmd.index("--header") + 1] == "Persistent Header\nMain Header"
 
     def test_gum_command_without_persistent_header(self) -> None:
         """Test that GumCommand works without persistent header."""
@@ -79,21 +74,17 @@ class TestGumCommand:
 
         cmd = gum_cmd.build()
 
-        # Find the header argument
-        header_index = cmd.index("--header")
-        header_value = cmd[header_index + 1]
-
-        assert header_value == "Main Header"
+        assert cmd[cmd.index("--header") + 1] == "Main Header"
 
 
 @pytest.mark.integration
 class TestMenuSystemNonTTY:
     """Test MenuSystem in non-TTY mode."""
 
-    def test_non_tty_shows_menu_and_returns_none(self, mocker: MockerFixture) -> None:
+    def test_non_tty_shows_menu_and_returns_none(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that non-TTY mode displays menu and returns None."""
-        mock_print = mocker.patch("builtins.print")
-
         menu_system = MenuSystem(is_tty=False)
         items = [
             MenuItem("1", "Option 1", "value1"),
@@ -103,20 +94,37 @@ class TestMenuSystemNonTTY:
         result = menu_system.show_menu(items, "Test Header")
 
         assert result is None
-        mock_print.assert_any_call("Test Header")
-        mock_print.assert_any_call("1 - Option 1")
-        mock_print.assert_any_call("2 - Option 2")
+        out_lines = capsys.readouterr().out.splitlines()
+        assert "Test Header" in out_lines
+        assert "1 - Option 1" in out_lines
+        assert "2 - Option 2" in out_lines
 
-    def test_non_tty_with_persistent_header(self, mocker: MockerFixture) -> None:
+    def test_non_tty_with_persistent_header(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that non-TTY mode includes persistent header."""
-        mock_print = mocker.patch("builtins.print")
-
         menu_system = MenuSystem(is_tty=False)
         items = [MenuItem("1", "Option 1")]
 
         menu_system.show_menu(items, "Test Header", persistent_header="Persistent")
 
-        mock_print.assert_any_call("Persistent")
+        assert capsys.readouterr().out.splitlines()[0] == "Persistent"
+
+    def test_avoid_gum_env_skips_gum_in_tty(
+        self, mocker: MockerFixture, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that URH_AVOID_GUM short-circuits to the non-TTY listing."""
+        mocker.patch.dict("os.environ", {"URH_AVOID_GUM": "1"})
+        mock_subprocess = mocker.MagicMock()
+
+        menu_system = MenuSystem(is_tty=True, subprocess_runner=mock_subprocess)
+        items = [MenuItem("1", "Option 1")]
+
+        result = menu_system.show_menu(items, "Test Header")
+
+        assert result is None
+        mock_subprocess.assert_not_called()
+        assert "1 - Option 1" in capsys.readouterr().out.splitlines()
 
 
 @pytest.mark.integration
@@ -138,11 +146,9 @@ class TestMenuSystemTextMenu:
         )
 
     def test_text_menu_displays_header_and_items(
-        self, mocker: MockerFixture, text_menu_system: MenuSystem
+        self, capsys: pytest.CaptureFixture[str], text_menu_system: MenuSystem
     ) -> None:
         """Test that text menu displays header and items correctly."""
-        mock_print = mocker.patch("builtins.print")
-
         items = [
             MenuItem("1", "Option 1", "value1"),
             MenuItem("2", "Option 2", "value2"),
@@ -150,26 +156,14 @@ class TestMenuSystemTextMenu:
 
         text_menu_system.show_menu(items, "Test Header")
 
-        mock_print.assert_any_call("Test Header")
-        mock_print.assert_any_call("Press ESC to cancel")
-        mock_print.assert_any_call("1. 1 - Option 1")
-        mock_print.assert_any_call("2. 2 - Option 2")
-
-    def test_text_menu_valid_selection_returns_key(
-        self, text_menu_system: MenuSystem
-    ) -> None:
-        """Test that valid text menu selection returns the key."""
-        items = [
-            MenuItem("1", "Option 1", "value1"),
-            MenuItem("2", "Option 2", "value2"),
-        ]
-
-        result = text_menu_system.show_menu(items, "Test Header")
-
-        assert result == "1"
+        out_lines = capsys.readouterr().out.splitlines()
+        assert "Test Header" in out_lines
+        assert "Press ESC to cancel" in out_lines
+        assert "1. 1 - Option 1" in out_lines
+        assert "2. 2 - Option 2" in out_lines
 
     def test_text_menu_valid_selection_returns_value_if_no_key(
-        self, mocker: MockerFixture, text_menu_system: MenuSystem
+        self, text_menu_system: MenuSystem
     ) -> None:
         """Test that text menu selection returns value when key is empty."""
         # ListItem has empty key, so value should be returned
@@ -184,20 +178,44 @@ class TestMenuSystemTextMenu:
 
         assert result == "value1"
 
-    def test_text_menu_invalid_choice_prompts_again(
-        self, mocker: MockerFixture, text_menu_system: MenuSystem
+    @pytest.mark.parametrize(
+        "inputs",
+        [["1"], ["99", "1"], ["bad", "0", "1"]],
+        ids=["valid", "out_of_range_then_valid", "garbage_then_valid"],
+    )
+    def test_text_menu_selection_retries_until_valid(
+        self, mocker: MockerFixture, text_menu_system: MenuSystem, inputs: list[str]
     ) -> None:
-        """Test that invalid choice prompts user again."""
-        # Set up input to return invalid then valid
-        text_menu_system._input_func.side_effect = ["99", "1"]  # type: ignore
+        """Test that invalid choices prompt again until a valid key is selected."""
+        text_menu_system._input_func.side_effect = inputs  # type: ignore
         mock_print = mocker.patch("builtins.print")
 
-        items = [MenuItem("1", "Option 1")]
+        items = [
+            MenuItem("1", "Option 1", "value1"),
+            MenuItem("2", "Option 2", "value2"),
+        ]
 
-        text_menu_system.show_menu(items, "Test Header")
+        result = text_menu_system.show_menu(items, "Test Header")
 
-        mock_print.assert_any_call("Invalid choice. Please try again.")
-        assert text_menu_system._input_func.call_count == 2  # type: ignore
+        assert result == "1"
+        assert text_menu_system._input_func.call_count == len(inputs)  # type: ignore
+        assert mock_print.call_args_list == [
+            mocker.call("Invalid choice. Please try again.")
+        ] * (len(inputs) - 1)
+
+    @pytest.mark.parametrize("choice", ["02", " 2 ", "+2"])
+    def test_text_menu_accepts_padded_choice_number(
+        self, text_menu_system: MenuSystem, choice: str
+    ) -> None:
+        """Test that a zero-padded or spaced number still selects its item."""
+        text_menu_system._input_func.return_value = choice  # type: ignore
+
+        items = [
+            MenuItem("1", "Option 1", "value1"),
+            MenuItem("2", "Option 2", "value2"),
+        ]
+
+        assert text_menu_system.show_menu(items, "Test Header") == "2"
 
     def test_text_menu_keyboard_interrupt_returns_none(
         self, mocker: MockerFixture, text_menu_system: MenuSystem
@@ -212,6 +230,28 @@ class TestMenuSystemTextMenu:
 
         assert result is None
 
+    def test_text_menu_keyboard_interrupt_in_main_menu_exits(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that keyboard interrupt (Ctrl+C) in the main menu exits with 0."""
+        mock_subprocess = mocker.MagicMock(side_effect=FileNotFoundError("gum"))
+        mock_input = mocker.MagicMock(side_effect=KeyboardInterrupt)
+        mock_exit = mocker.MagicMock()
+
+        menu_system = MenuSystem(
+            is_tty=True,
+            subprocess_runner=mock_subprocess,
+            input_func=mock_input,
+            exit_func=mock_exit,
+        )
+        items = [MenuItem("1", "Option 1")]
+
+        result = menu_system.show_menu(items, "Test Header", is_main_menu=True)
+
+        assert result is None
+        mock_exit.assert_called_once_with(0)
+        mock_input.assert_called_once()
+
 
 @pytest.mark.integration
 class TestMenuSystemGumMenu:
@@ -304,7 +344,7 @@ class TestMenuSystemGumMenu:
         result = gum_menu_system.show_menu(items, "Test Header")
 
         assert result is None
-        mock_print.assert_any_call("Menu selection timed out.")
+        mock_print.assert_called_once_with("Menu selection timed out.")
 
 
 @pytest.mark.integration
@@ -362,4 +402,4 @@ class TestMenuSystemESCHandling:
         result = menu_system.show_menu(items, "Test Header", is_main_menu=True)
 
         assert result is None
-        mock_print.assert_any_call("No option selected.")
+        mock_print.assert_called_once_with("No option selected.")
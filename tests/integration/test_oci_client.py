@@ -14,44 +14,86 @@ Following TEST_DESIGN.md principles:
 - Test through public API methods (fetch_repository_tags, get_all_tags)
 """
 
+import json
+import os
 import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
 
 import pytest
 from pytest_mock import MockerFixture
 
-from src.urh.oci_client import OCIClient
+from src.urh.config import (
+    ContainerURLsConfig,
+    RepositoryConfig,
+    SettingsConfig,
+    URHConfig,
+)
+from src.urh.constants import FILTERED_TAGS_TTL
+from src.urh.oci_client import OCIClient, get_client
+from src.urh.tag_filter import OCITagFilter
+from src.urh.token_manager import OCITokenManager
 
 
-@pytest.mark.integration
-class TestOCIClientHTTPResponseParsing:
-    """Test HTTP response parsing in OCIClient."""
+def _stub_token_manager() -> SimpleNamespace:
+    """Create a plain stub token manager for fixtures that never assert on it.
 
-    @pytest.fixture
-    def oci_client(self, mocker: MockerFixture) -> OCIClient:
-        """Create OCIClient with mocked token manager."""
-        # Mock token manager to return a test token
-        mock_token_manager = mocker.MagicMock()
-        mock_token_manager.get_token.return_value = "test_token"
-        mock_token_manager.invalidate_cache = mocker.MagicMock()
-        mock_token_manager.parse_link_header = mocker.MagicMock()
+    Cheaper to build than a MagicMock; fixtures that inspect calls keep mocks.
+    """
+    return SimpleNamespace(
+        get_token=lambda *args, **kwargs: "test_token",
+        invalidate_cache=lambda: None,
+        parse_link_header=lambda link_header: None,
+    )
 
-        client = OCIClient("test/repo")
-        client.token_manager = mock_token_manager
-        return client
 
-    def test_parse_http_response_with_crlf_separators(
-        self, oci_client: OCIClient
-    ) -> None:
+def _curl_output(response: str) -> subprocess.CompletedProcess[bytes]:
+    """Build a successful curl run whose stdout is the given raw HTTP response."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=response.encode(), stderr=b""
+    )
+
+
+def _tag_listing(tags: list[str]) -> Any:
+    """Build a get_all_tags stand-in that applies tag_predicate like the real one."""
+
+    def get_all_tags(
+        context_url: Optional[str] = None,
+        tag_predicate: Optional[Callable[[str], bool]] = None,
+    ) -> dict[str, Any]:
+        return {"tags": [t for t in tags if tag_predicate is None or tag_predicate(t)]}
+
+    return get_all_tags
+
+
+@pytest.fixture
+def mock_run(mocker: MockerFixture) -> Any:
+    """Patch subprocess.run (curl) once per test; tests set its result."""
+    return mocker.patch("subprocess.run")
+
+
+@pytest.fixture
+def tags_cache_path(tmp_path: Path) -> str:
+    """Get a fresh tag page cache file, keeping tests off the user's real one."""
+    return str(tmp_path / "tags.json")
+
+
+@pytest.mark.integration
+class TestOCIClientHTTPResponseParsing:
+    """Test HTTP response parsing in OCIClient (a staticmethod, no client needed)."""
+
+    def test_parse_http_response_with_crlf_separators(self) -> None:
         """Test parsing HTTP response with CRLF line endings."""
         response = (
-            "HTTP/2 200\r\n"
-            "Content-Type: application/json\r\n"
-            'Link: <next-page>; rel="next"\r\n'
-            "\r\n"
-            '{"tags": ["v1.0", "v2.0"]}'
+            b"HTTP/2 200\r\n"
+            b"Content-Type: application/json\r\n"
+            b'Link: <next-page>; rel="next"\r\n'
+            b"\r\n"
+            b'{"tags": ["v1.0", "v2.0"]}'
         )
 
-        status_line, body, headers = oci_client._parse_http_response(response)
+        status_line, body, headers = OCIClient._parse_http_response(response)
 
         assert status_line == "HTTP/2 200"
         assert body == '{"tags": ["v1.0", "v2.0"]}'
@@ -59,35 +101,29 @@ class TestOCIClientHTTPResponseParsing:
         assert headers["content-type"] == "application/json"
         assert headers["link"] == '<next-page>; rel="next"'
 
-    def test_parse_http_response_with_lf_separators(
-        self, oci_client: OCIClient
-    ) -> None:
+    def test_parse_http_response_with_lf_separators(self) -> None:
         """Test parsing HTTP response with LF line endings."""
-        response = 'HTTP/2 200\nContent-Type: application/json\n\n{"tags": ["v1.0"]}'
+        response = b'HTTP/2 200\nContent-Type: application/json\n\n{"tags": ["v1.0"]}'
 
-        status_line, body, headers = oci_client._parse_http_response(response)
+        status_line, body, headers = OCIClient._parse_http_response(response)
 
         assert status_line == "HTTP/2 200"
         assert body == '{"tags": ["v1.0"]}'
         assert headers is not None
 
-    def test_parse_http_response_malformed_returns_none(
-        self, oci_client: OCIClient
-    ) -> None:
+    def test_parse_http_response_malformed_returns_none(self) -> None:
         """Test parsing malformed response returns None."""
-        response = "Invalid response without separators"
+        response = b"Invalid response without separators"
 
-        result = oci_client._parse_http_response(response)
+        result = OCIClient._parse_http_response(response)
 
         assert result == (None, None, None)
 
-    def test_parse_http_response_empty_returns_none(
-        self, oci_client: OCIClient
-    ) -> None:
+    def test_parse_http_response_empty_returns_none(self) -> None:
         """Test parsing empty response returns None."""
-        response = ""
+        response = b""
 
-        result = oci_client._parse_http_response(response)
+        result = OCIClient._parse_http_response(response)
 
         assert result == (None, None, None)
 
@@ -97,19 +133,23 @@ class TestOCIClientPagination:
     """Test pagination logic in OCIClient."""
 
     @pytest.fixture
-    def oci_client_with_mocks(self, mocker: MockerFixture) -> OCIClient:
+    def oci_client_with_mocks(
+        self, mocker: MockerFixture, tags_cache_path: str
+    ) -> OCIClient:
         """Create OCIClient with mocked dependencies for pagination tests."""
         mock_token_manager = mocker.MagicMock()
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager.invalidate_cache = mocker.MagicMock()
         mock_token_manager.parse_link_header = mocker.MagicMock()
 
-        client = OCIClient("test/repo")
-        client.token_manager = mock_token_manager
-        return client
+        return OCIClient(
+            "test/repo",
+            tags_cache_path=tags_cache_path,
+            token_manager=mock_token_manager,
+        )
 
     def test_extract_next_url_from_link_header(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_with_mocks: OCIClient
     ) -> None:
         """Test extracting next URL from Link header."""
         # Setup mock to return next URL
@@ -135,20 +175,35 @@ class TestOCIClientPagination:
 
         assert next_url is None
 
-    def test_fetch_page_with_headers_success(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+    @pytest.mark.parametrize(
+        ("link_line", "expected_next"),
+        [
+            ("", None),
+            (
+                'Link: </v2/test/repo/tags/list?last=tag2&n=200>; rel="next"\r\n',
+                "https://ghcr.io/v2/test/repo/tags/list?last=tag2&n=200",
+            ),
+        ],
+        ids=["single_page", "with_next_link"],
+    )
+    def test_fetch_page_with_headers(
+        self,
+        oci_client_with_mocks: OCIClient,
+        mock_run: Any,
+        link_line: str,
+        expected_next: Optional[str],
     ) -> None:
-        """Test successful page fetch with headers."""
-        # Mock subprocess.run to return valid response
+        """Test page fetch returns the tags and the next URL from Link."""
         mock_response = (
             "HTTP/2 200\r\n"
             "Content-Type: application/json\r\n"
+            f"{link_line}"
             "\r\n"
             '{"tags": ["v1.0", "v2.0"]}'
         )
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=mock_response, stderr=""
+        mock_run.return_value = _curl_output(mock_response)
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = (  # type: ignore[assignment]
+            expected_next
         )
 
         data, next_url = oci_client_with_mocks._fetch_page_with_headers(
@@ -157,42 +212,34 @@ class TestOCIClientPagination:
 
         assert data is not None
         assert data["tags"] == ["v1.0", "v2.0"]
-        assert next_url is None  # No Link header in response
+        assert next_url == expected_next
 
-    def test_fetch_page_with_headers_with_pagination(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+    def test_fetch_page_timeout_returns_none(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
     ) -> None:
-        """Test page fetch with Link header for pagination."""
-        mock_response = (
-            "HTTP/2 200\r\n"
-            "Content-Type: application/json\r\n"
-            'Link: </v2/test/repo/tags/list?last=tag2&n=200>; rel="next"\r\n'
-            "\r\n"
-            '{"tags": ["v1.0", "v2.0"]}'
-        )
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=mock_response, stderr=""
-        )
-
-        # Mock parse_link_header to return next URL
-        oci_client_with_mocks.token_manager.parse_link_header.return_value = (  # type: ignore[assignment]
-            "https://ghcr.io/v2/test/repo/tags/list?last=tag2&n=200"
-        )
+        """Test timeout during page fetch returns None."""
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["curl"], timeout=30)
 
         data, next_url = oci_client_with_mocks._fetch_page_with_headers(
             "https://ghcr.io/v2/test/repo/tags/list", "test_token"
         )
 
-        assert data is not None
-        assert next_url == "https://ghcr.io/v2/test/repo/tags/list?last=tag2&n=200"
+        assert data is None
+        assert next_url is None
 
-    def test_fetch_page_timeout_returns_none(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+    @pytest.mark.parametrize(
+        "response",
+        [
+            'HTTP/2 404\r\n\r\n{"errors": [{"code": "NAME_UNKNOWN"}]}',
+            'HTTP/2 500\r\n\r\n{"tags": ["v1.0"]}',
+        ],
+        ids=["ghcr_error_body", "tags_body"],
+    )
+    def test_fetch_page_error_status_returns_none(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any, response: str
     ) -> None:
-        """Test timeout during page fetch returns None."""
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd=["curl"], timeout=30)
+        """Test a 4xx/5xx status fails the page whatever the body holds."""
+        mock_run.return_value = _curl_output(response)
 
         data, next_url = oci_client_with_mocks._fetch_page_with_headers(
             "https://ghcr.io/v2/test/repo/tags/list", "test_token"
@@ -202,7 +249,7 @@ class TestOCIClientPagination:
         assert next_url is None
 
     def test_get_all_tags_single_page(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
     ) -> None:
         """Test get_all_tags with single page response."""
         mock_response = (
@@ -211,18 +258,83 @@ class TestOCIClientPagination:
             "\r\n"
             '{"tags": ["v1.0", "v2.0", "v3.0"]}'
         )
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=mock_response, stderr=""
-        )
+        mock_run.return_value = _curl_output(mock_response)
 
         result = oci_client_with_mocks.get_all_tags()
 
         assert result is not None
         assert result["tags"] == ["v1.0", "v2.0", "v3.0"]
 
+    def test_get_all_tags_with_injected_dependencies(
+        self, tags_cache_path: str
+    ) -> None:
+        """Test injected token manager and subprocess runner are used for curl."""
+        commands = []
+
+        def fake_runner(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(
+                args=cmd,
+                returncode=0,
+                stdout=b'HTTP/2 200\r\n\r\n{"tags": ["v1.0"]}',
+                stderr=b"",
+            )
+
+        client = OCIClient(
+            "test/repo",
+            tags_cache_path=tags_cache_path,
+            token_manager=_stub_token_manager(),  # type: ignore[arg-type]
+            subprocess_runner=fake_runner,
+        )
+
+        result = client.get_all_tags()
+
+        assert result == {"tags": ["v1.0"]}
+        assert len(commands) == 1
+        assert "Authorization: Bearer test_token" in commands[0]
+
+    def test_get_all_tags_bounds_page_timeout_by_total_budget(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test each curl call gets no more than what is left of the budget."""
+        mock_run.return_value = _curl_output('HTTP/2 200\r\n\r\n{"tags": []}')
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+
+        oci_client_with_mocks.get_all_tags(total_timeout=5)
+
+        assert 0 < mock_run.call_args.kwargs["timeout"] <= 5
+
+    def test_get_all_tags_stops_when_total_budget_spent(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test no page is requested once the overall timeout is used up."""
+
+        result = oci_client_with_mocks.get_all_tags(total_timeout=0)
+
+        assert result is None
+        mock_run.assert_not_called()
+
+    def test_get_all_tags_applies_tag_predicate_per_page(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test tags rejected by tag_predicate are dropped while paginating."""
+        mock_response = (
+            "HTTP/2 200\r\n"
+            "Content-Type: application/json\r\n"
+            "\r\n"
+            '{"tags": ["v1.0", "sha256-abc.sig", "v2.0"]}'
+        )
+        mock_run.return_value = _curl_output(mock_response)
+
+        result = oci_client_with_mocks.get_all_tags(
+            tag_predicate=lambda tag: not tag.startswith("sha256-")
+        )
+
+        assert result is not None
+        assert result["tags"] == ["v1.0", "v2.0"]
+
     def test_get_all_tags_multiple_pages(
-        self, oci_client_with_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
     ) -> None:
         """Test get_all_tags follows pagination."""
         # First page with Link header
@@ -241,14 +353,9 @@ class TestOCIClientPagination:
             '{"tags": ["v3.0", "v4.0"]}'
         )
 
-        mock_run = mocker.patch("subprocess.run")
         mock_run.side_effect = [
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response1, stderr=""
-            ),
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response2, stderr=""
-            ),
+            _curl_output(response1),
+            _curl_output(response2),
         ]
 
         # Mock parse_link_header to return next URL first time, None second
@@ -264,25 +371,216 @@ class TestOCIClientPagination:
         assert "v1.0" in result["tags"]
         assert "v4.0" in result["tags"]
 
+    def test_get_all_tags_marks_partial_result_when_later_page_fails(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test tags from earlier pages come back flagged as incomplete."""
+        mock_run.side_effect = [
+            _curl_output(
+                "HTTP/2 200\r\n"
+                'Link: </v2/test/repo/tags/list?last=v1.0&n=200>; rel="next"\r\n'
+                "\r\n"
+                '{"tags": ["v1.0"]}'
+            ),
+            subprocess.TimeoutExpired(cmd=["curl"], timeout=30),
+        ]
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = (  # type: ignore[assignment]
+            "https://ghcr.io/v2/test/repo/tags/list?last=v1.0&n=200"
+        )
+
+        result = oci_client_with_mocks.get_all_tags()
+
+        assert result == {"tags": ["v1.0"], "complete": False}
+
+    def test_get_all_tags_revalidates_cached_page_with_etag(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a 304 on a page with a known ETag reuses the cached tags."""
+        fresh = 'HTTP/2 200\r\nETag: "abc"\r\n\r\n{"tags": ["v1.0", "v2.0"]}'
+        not_modified = 'HTTP/2 304\r\nETag: "abc"\r\n\r\n'
+
+        mock_run.side_effect = [
+            _curl_output(fresh),
+            _curl_output(not_modified),
+        ]
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+
+        first = oci_client_with_mocks.get_all_tags()
+        second = oci_client_with_mocks.get_all_tags()
+
+        assert first == second == {"tags": ["v1.0", "v2.0"]}
+        revalidate_cmd = mock_run.call_args_list[1][0][0]
+        assert 'If-None-Match: "abc"' in revalidate_cmd
+
+    def test_get_all_tags_reuses_page_cache_across_clients(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a later run (new client) revalidates pages cached on disk."""
+        fresh = 'HTTP/2 200\r\nETag: "abc"\r\n\r\n{"tags": ["v1.0"]}'
+        not_modified = 'HTTP/2 304\r\nETag: "abc"\r\n\r\n'
+        mock_run.side_effect = [
+            _curl_output(fresh),
+            _curl_output(not_modified),
+        ]
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+        oci_client_with_mocks.get_all_tags()
+
+        next_run = OCIClient(
+            "test/repo",
+            tags_cache_path=oci_client_with_mocks.tags_cache_path,
+            token_manager=oci_client_with_mocks.token_manager,
+        )
+
+        assert next_run.get_all_tags() == {"tags": ["v1.0"]}
+        assert 'If-None-Match: "abc"' in mock_run.call_args_list[1][0][0]
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            {"etag": '"x"'},
+            "not-a-page",
+            ["v1.0"],
+            {"etag": "*", "tags": ["fake"], "next": "https://attacker.example/x"},
+            {"etag": '"a"', "tags": [1, None], "next": None},
+            {"etag": '"a"\r\nX-Injected: 1', "tags": ["v1.0"], "next": None},
+        ],
+        ids=[
+            "missing_tags",
+            "string",
+            "list",
+            "foreign_next",
+            "non_string_tags",
+            "multiline_etag",
+        ],
+    )
+    def test_get_all_tags_ignores_invalid_cached_pages(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any, entry: Any
+    ) -> None:
+        """Test malformed or off-registry cache entries are refetched, not trusted."""
+        url = "https://ghcr.io/v2/test/repo/tags/list?n=200"
+        cache_file = Path(oci_client_with_mocks.tags_cache_path)
+        cache_file.write_text(json.dumps({"test/repo": {url: entry}}))
+        mock_run.return_value = _curl_output(
+            'HTTP/2 200\r\nETag: "abc"\r\n\r\n{"tags": ["v1.0"]}'
+        )
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+
+        assert oci_client_with_mocks.get_all_tags() == {"tags": ["v1.0"]}
+        assert mock_run.call_count == 1
+        assert not any(
+            arg.startswith("If-None-Match") for arg in mock_run.call_args[0][0]
+        )
+        assert json.loads(cache_file.read_text())["test/repo"][url]["etag"] == '"abc"'
+
+    def test_get_all_tags_drops_cached_page_that_fails(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a cached page whose fetch errors is removed from the cache file."""
+        url = "https://ghcr.io/v2/test/repo/tags/list?n=200"
+        cache_file = Path(oci_client_with_mocks.tags_cache_path)
+        cache_file.write_text(
+            json.dumps({"test/repo": {url: {"etag": '"a"', "tags": [], "next": None}}})
+        )
+        mock_run.side_effect = OSError("curl failed")
+
+        assert oci_client_with_mocks.get_all_tags() is None
+        assert json.loads(cache_file.read_text()) == {"test/repo": {}}
+
+    def test_get_all_tags_keeps_cached_page_when_curl_fails(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a transient curl failure leaves the cached page in place."""
+        url = "https://ghcr.io/v2/test/repo/tags/list?n=200"
+        cache = {"test/repo": {url: {"etag": '"a"', "tags": ["v1.0"], "next": None}}}
+        cache_file = Path(oci_client_with_mocks.tags_cache_path)
+        cache_file.write_text(json.dumps(cache))
+        mock_run.side_effect = subprocess.CalledProcessError(6, ["curl"])
+
+        assert oci_client_with_mocks.get_all_tags() is None
+        assert json.loads(cache_file.read_text()) == cache
+
+    def test_get_all_tags_prunes_pages_not_visited(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a complete crawl drops cursor pages it no longer reaches."""
+        first = "https://ghcr.io/v2/test/repo/tags/list?n=200"
+        stale = "https://ghcr.io/v2/test/repo/tags/list?last=v0.9&n=200"
+        cache_file = Path(oci_client_with_mocks.tags_cache_path)
+        cache_file.write_text(
+            json.dumps(
+                {"test/repo": {stale: {"etag": '"old"', "tags": [], "next": None}}}
+            )
+        )
+        mock_run.return_value = _curl_output(
+            'HTTP/2 200\r\nETag: "abc"\r\n\r\n{"tags": ["v1.0"]}'
+        )
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+
+        assert oci_client_with_mocks.get_all_tags() == {"tags": ["v1.0"]}
+        assert list(json.loads(cache_file.read_text())["test/repo"]) == [first]
+
+    def test_get_all_tags_drops_cached_page_served_without_etag(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any
+    ) -> None:
+        """Test a 200 without an ETag removes the page's stale cache entry."""
+        url = "https://ghcr.io/v2/test/repo/tags/list?n=200"
+        cache_file = Path(oci_client_with_mocks.tags_cache_path)
+        cache_file.write_text(
+            json.dumps({"test/repo": {url: {"etag": '"a"', "tags": [], "next": None}}})
+        )
+        mock_run.return_value = _curl_output('HTTP/2 200\r\n\r\n{"tags": ["v1.0"]}')
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+
+        assert oci_client_with_mocks.get_all_tags() == {"tags": ["v1.0"]}
+        assert json.loads(cache_file.read_text()) == {"test/repo": {}}
+
+    def test_get_all_tags_removes_temp_file_when_cache_rename_fails(
+        self, oci_client_with_mocks: OCIClient, mock_run: Any, mocker: MockerFixture
+    ) -> None:
+        """Test a failed tag cache rename leaves no temp file behind."""
+        mock_run.return_value = _curl_output(
+            'HTTP/2 200\r\nETag: "abc"\r\n\r\n{"tags": ["v1.0"]}'
+        )
+        oci_client_with_mocks.token_manager.parse_link_header.return_value = None  # type: ignore[attr-defined]
+        mocker.patch("os.replace", side_effect=PermissionError("not owner"))
+        cache_dir = Path(oci_client_with_mocks.tags_cache_path).parent
+
+        assert oci_client_with_mocks.get_all_tags() == {"tags": ["v1.0"]}
+        assert list(cache_dir.glob("*.tmp")) == []
+
+    def test_tags_cache_defaults_to_per_user_cache_dir(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test the tag page cache lives under $XDG_CACHE_HOME, not shared /tmp."""
+        mocker.patch.dict(os.environ, {"XDG_CACHE_HOME": str(tmp_path)})
+
+        client = OCIClient("test/repo", token_manager=_stub_token_manager())  # type: ignore[arg-type]
+
+        assert client.tags_cache_path == str(tmp_path / "urh" / "oci_ghcr_tags.json")
+
 
 @pytest.mark.integration
 class TestOCIClientAuthHandling:
     """Test authentication error handling in OCIClient."""
 
     @pytest.fixture
-    def oci_client_auth_mocks(self, mocker: MockerFixture) -> OCIClient:
+    def oci_client_auth_mocks(
+        self, mocker: MockerFixture, tags_cache_path: str
+    ) -> OCIClient:
         """Create OCIClient with mocked token manager for auth tests."""
         mock_token_manager = mocker.MagicMock()
         mock_token_manager.get_token.return_value = "test_token"
         mock_token_manager.invalidate_cache = mocker.MagicMock()
         mock_token_manager.parse_link_header = mocker.MagicMock()
 
-        client = OCIClient("test/repo")
-        client.token_manager = mock_token_manager
-        return client
+        return OCIClient(
+            "test/repo",
+            tags_cache_path=tags_cache_path,
+            token_manager=mock_token_manager,
+        )
 
     def test_auth_error_401_invalidates_token_and_retries(
-        self, oci_client_auth_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_auth_mocks: OCIClient, mock_run: Any
     ) -> None:
         """Test 401 auth error invalidates token and retries."""
         # First response: 401 Unauthorized
@@ -292,14 +590,9 @@ class TestOCIClientAuthHandling:
             'HTTP/2 200\r\nContent-Type: application/json\r\n\r\n{"tags": ["v1.0"]}'
         )
 
-        mock_run = mocker.patch("subprocess.run")
         mock_run.side_effect = [
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response1, stderr=""
-            ),
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response2, stderr=""
-            ),
+            _curl_output(response1),
+            _curl_output(response2),
         ]
 
         # Mock new token after invalidation
@@ -318,7 +611,7 @@ class TestOCIClientAuthHandling:
         assert data["tags"] == ["v1.0"]
 
     def test_auth_error_403_invalidates_token_and_retries(
-        self, oci_client_auth_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_auth_mocks: OCIClient, mock_run: Any
     ) -> None:
         """Test 403 auth error invalidates token and retries."""
         response1 = "HTTP/1.1 403 Forbidden\r\n\r\n"
@@ -326,14 +619,9 @@ class TestOCIClientAuthHandling:
             'HTTP/2 200\r\nContent-Type: application/json\r\n\r\n{"tags": ["v1.0"]}'
         )
 
-        mock_run = mocker.patch("subprocess.run")
         mock_run.side_effect = [
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response1, stderr=""
-            ),
-            subprocess.CompletedProcess(
-                args=[], returncode=0, stdout=response2, stderr=""
-            ),
+            _curl_output(response1),
+            _curl_output(response2),
         ]
 
         oci_client_auth_mocks.token_manager.get_token.return_value = "new_token"  # type: ignore[assignment]
@@ -346,15 +634,12 @@ class TestOCIClientAuthHandling:
         assert data is not None
 
     def test_auth_error_retry_fails_returns_none(
-        self, oci_client_auth_mocks: OCIClient, mocker: MockerFixture
+        self, oci_client_auth_mocks: OCIClient, mock_run: Any
     ) -> None:
         """Test auth error retry fails when new token unavailable."""
         response1 = "HTTP/1.1 401 Unauthorized\r\n\r\n"
 
-        mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=response1, stderr=""
-        )
+        mock_run.return_value = _curl_output(response1)
 
         # Mock token manager to return None (no new token)
         oci_client_auth_mocks.token_manager.get_token.return_value = None  # type: ignore[assignment]
@@ -366,22 +651,78 @@ class TestOCIClientAuthHandling:
         assert data is None
         assert next_url is None
 
+    def test_auth_error_retry_bounded_by_crawl_deadline(
+        self, oci_client_auth_mocks: OCIClient, mock_run: Any, mocker: MockerFixture
+    ) -> None:
+        """Test the retry after a 401 only gets what is left of the crawl budget."""
+        mock_run.side_effect = [
+            _curl_output("HTTP/1.1 401 Unauthorized\r\n\r\n"),
+            _curl_output('HTTP/2 200\r\n\r\n{"tags": ["v1.0"]}'),
+        ]
+        mocker.patch("src.urh.oci_client.time.monotonic", return_value=100.0)
+
+        data, _ = oci_client_auth_mocks._fetch_page_with_headers(
+            "https://ghcr.io/v2/test/repo/tags/list", "test_token", deadline=105.0
+        )
+
+        assert data == {"tags": ["v1.0"]}
+        assert mock_run.call_args_list[1].kwargs["timeout"] == 5.0
+
+    def test_auth_error_no_retry_after_crawl_deadline(
+        self, oci_client_auth_mocks: OCIClient, mock_run: Any, mocker: MockerFixture
+    ) -> None:
+        """Test a 401 is not retried once the crawl deadline has passed."""
+        mock_run.return_value = _curl_output("HTTP/1.1 401 Unauthorized\r\n\r\n")
+        mocker.patch("src.urh.oci_client.time.monotonic", return_value=100.0)
+
+        result = oci_client_auth_mocks._fetch_page_with_headers(
+            "https://ghcr.io/v2/test/repo/tags/list", "test_token", deadline=100.0
+        )
+
+        assert result == (None, None)
+        assert mock_run.call_count == 1
+
+    @pytest.mark.parametrize(
+        "status_line,is_auth_error",
+        [
+            ("HTTP/1.1 401 Unauthorized", True),
+            ("HTTP/2 403", True),
+            ("HTTP/2 200", False),
+            ("HTTP/1.1 200 OK 401", False),
+            ("HTTP/2 404 Not Found", False),
+        ],
+    )
+    def test_auth_error_detected_from_status_code_only(
+        self,
+        oci_client_auth_mocks: OCIClient,
+        mock_run: Any,
+        status_line: str,
+        is_auth_error: bool,
+    ) -> None:
+        """Test only a 401/403 status code triggers the auth retry path."""
+        retry_response = 'HTTP/2 200\r\n\r\n{"tags": ["v1.0"]}'
+        mock_run.return_value = _curl_output(retry_response)
+
+        result = oci_client_auth_mocks._check_auth_error(
+            status_line, "https://ghcr.io/v2/test/repo/tags/list", "test_token"
+        )
+
+        assert (result is not None) == is_auth_error
+        assert mock_run.called == is_auth_error
+
 
 @pytest.mark.integration
 class TestOCIClientJSONParsing:
     """Test JSON response parsing in OCIClient."""
 
     @pytest.fixture
-    def oci_client_json_mocks(self, mocker: MockerFixture) -> OCIClient:
+    def oci_client_json_mocks(self, tags_cache_path: str) -> OCIClient:
         """Create OCIClient for JSON parsing tests."""
-        mock_token_manager = mocker.MagicMock()
-        mock_token_manager.get_token.return_value = "test_token"
-        mock_token_manager.invalidate_cache = mocker.MagicMock()
-        mock_token_manager.parse_link_header = mocker.MagicMock()
-
-        client = OCIClient("test/repo")
-        client.token_manager = mock_token_manager
-        return client
+        return OCIClient(
+            "test/repo",
+            tags_cache_path=tags_cache_path,
+            token_manager=_stub_token_manager(),  # type: ignore[arg-type]
+        )
 
     def test_parse_response_body_valid_json(
         self, oci_client_json_mocks: OCIClient
@@ -414,6 +755,22 @@ class TestOCIClientJSONParsing:
 
         assert data is None
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            '["v1.0", "v2.0"]',
+            '{ "errors": [{"code": "DENIED"}] }',
+            '{"tags": null}',
+            '{"tags": "abc"}',
+        ],
+        ids=["not_an_object", "spaced_error_object", "null_tags", "string_tags"],
+    )
+    def test_parse_response_body_unexpected_shape_returns_none(
+        self, oci_client_json_mocks: OCIClient, body: str
+    ) -> None:
+        """Test JSON that is not a tags object is rejected after parsing."""
+        assert oci_client_json_mocks._parse_response_body(body) is None
+
     def test_parse_response_body_ghcr_error_returns_none(
         self, oci_client_json_mocks: OCIClient
     ) -> None:
@@ -432,16 +789,9 @@ class TestOCIClientTagFiltering:
     """Test tag filtering integration in OCIClient."""
 
     @pytest.fixture
-    def oci_client_with_config(self, mocker: MockerFixture) -> OCIClient:
+    def oci_client_with_config(self, tags_cache_path: str) -> OCIClient:
         """Create OCIClient with test config for filtering tests."""
         # Mock config with filter rules
-        from src.urh.config import (
-            ContainerURLsConfig,
-            RepositoryConfig,
-            SettingsConfig,
-            URHConfig,
-        )
-
         mock_config = URHConfig()
         mock_config.settings = SettingsConfig(max_tags_display=30, debug_mode=False)
         mock_config.container_urls = ContainerURLsConfig(
@@ -456,14 +806,12 @@ class TestOCIClientTagFiltering:
             ignore_tags=["latest", "testing", "stable", "unstable"],
         )
 
-        mock_token_manager = mocker.MagicMock()
-        mock_token_manager.get_token.return_value = "test_token"
-        mock_token_manager.invalidate_cache = mocker.MagicMock()
-        mock_token_manager.parse_link_header = mocker.MagicMock()
-
-        client = OCIClient("test/repo")
+        client = OCIClient(
+            "test/repo",
+            tags_cache_path=tags_cache_path,
+            token_manager=_stub_token_manager(),  # type: ignore[arg-type]
+        )
         client.config = mock_config
-        client.token_manager = mock_token_manager
         return client
 
     def test_fetch_repository_tags_filters_and_sorts(
@@ -480,7 +828,7 @@ class TestOCIClientTagFiltering:
             "v1.5.0",
         ]
         mocker.patch.object(
-            oci_client_with_config, "get_all_tags", return_value={"tags": raw_tags}
+            oci_client_with_config, "get_all_tags", side_effect=_tag_listing(raw_tags)
         )
 
         result = oci_client_with_config.fetch_repository_tags()
@@ -495,6 +843,109 @@ class TestOCIClientTagFiltering:
         assert "v1.5.0" in result["tags"]
         assert "v1.0.0" in result["tags"]
 
+    def test_fetch_repository_tags_checks_each_tag_once(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test tags filtered during pagination are not filtered again."""
+        raw_tags = ["latest", "v1.0.0", "v2.0.0"]
+        mocker.patch.object(
+            oci_client_with_config, "get_all_tags", side_effect=_tag_listing(raw_tags)
+        )
+        keep_tag = mocker.spy(OCITagFilter, "keep_tag")
+
+        result = oci_client_with_config.fetch_repository_tags()
+
+        assert result == {"tags": ["v2.0.0", "v1.0.0"]}
+        assert keep_tag.call_count == len(raw_tags)
+
+    def test_fetch_repository_tags_collapses_duplicate_tags(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test tags repeated across pages are returned once, in sorted order."""
+        raw_tags = ["v1.0.0", "20231115", "v2.0.0", "v1.0.0", "20231115", "20231120"]
+        mocker.patch.object(
+            oci_client_with_config, "get_all_tags", side_effect=_tag_listing(raw_tags)
+        )
+
+        result = oci_client_with_config.fetch_repository_tags()
+
+        assert result is not None
+        assert result["tags"] == ["20231120", "20231115", "v2.0.0", "v1.0.0"]
+
+    def test_fetch_repository_tags_memoized_per_context(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test repeat fetches for a context reuse the result."""
+        get_all_tags = mocker.patch.object(
+            oci_client_with_config,
+            "get_all_tags",
+            side_effect=_tag_listing(["testing-42.20231115.0", "42.20231115.0"]),
+        )
+        url = "ghcr.io/test/repo:testing"
+
+        first = oci_client_with_config.fetch_repository_tags(url)
+        second = oci_client_with_config.fetch_repository_tags(url)
+        oci_client_with_config.fetch_repository_tags()  # different context
+
+        assert first == second == {"tags": ["testing-42.20231115.0"]}
+        assert get_all_tags.call_count == 2
+
+    def test_fetch_repository_tags_memo_expires_after_ttl(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test a memoized listing is fetched again once FILTERED_TAGS_TTL passes."""
+        get_all_tags = mocker.patch.object(
+            oci_client_with_config,
+            "get_all_tags",
+            side_effect=_tag_listing(["v1.0.0"]),
+        )
+        now = mocker.patch("src.urh.oci_client.time.monotonic", return_value=1000.0)
+
+        oci_client_with_config.fetch_repository_tags()
+        now.return_value += FILTERED_TAGS_TTL - 1
+        oci_client_with_config.fetch_repository_tags()
+        assert get_all_tags.call_count == 1
+
+        now.return_value += 1
+        oci_client_with_config.fetch_repository_tags()
+
+        assert get_all_tags.call_count == 2
+
+    def test_fetch_repository_tags_does_not_memoize_partial_results(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test a truncated listing is returned but fetched again next time."""
+        get_all_tags = mocker.patch.object(
+            oci_client_with_config,
+            "get_all_tags",
+            return_value={"tags": ["testing-42.20231115.0"], "complete": False},
+        )
+        url = "ghcr.io/test/repo:testing"
+
+        first = oci_client_with_config.fetch_repository_tags(url)
+        oci_client_with_config.fetch_repository_tags(url)
+
+        assert first == {"tags": ["testing-42.20231115.0"]}
+        assert get_all_tags.call_count == 2
+
+    def test_fetch_repository_tags_filter_patterns_with_conditional_group(
+        self, oci_client_with_config: OCIClient, mocker: MockerFixture
+    ) -> None:
+        """Test a numbered conditional group still matches when patterns combine."""
+        oci_client_with_config.config.repositories["test/repo"].filter_patterns = [
+            "(x)y",
+            "(a)?(?(1)b|c)$",
+        ]
+        mocker.patch.object(
+            oci_client_with_config,
+            "get_all_tags",
+            side_effect=_tag_listing(["ab", "c", "ac", "v1.0.0"]),
+        )
+
+        result = oci_client_with_config.fetch_repository_tags()
+
+        assert result == {"tags": ["v1.0.0", "ac"]}
+
     def test_fetch_repository_tags_with_context_filtering(
         self, oci_client_with_config: OCIClient, mocker: MockerFixture
     ) -> None:
@@ -506,7 +957,7 @@ class TestOCIClientTagFiltering:
             "v1.0.0",
         ]
         mocker.patch.object(
-            oci_client_with_config, "get_all_tags", return_value={"tags": raw_tags}
+            oci_client_with_config, "get_all_tags", side_effect=_tag_listing(raw_tags)
         )
 
         # Test with testing context
@@ -525,7 +976,7 @@ class TestOCIClientTagFiltering:
         # Generate many tags
         raw_tags = [f"v{i}.0.0" for i in range(1, 101)]  # 100 tags
         mocker.patch.object(
-            oci_client_with_config, "get_all_tags", return_value={"tags": raw_tags}
+            oci_client_with_config, "get_all_tags", side_effect=_tag_listing(raw_tags)
         )
 
         # Set max display to 10
@@ -545,3 +996,101 @@ class TestOCIClientTagFiltering:
         result = oci_client_with_config.fetch_repository_tags()
 
         assert result is None
+
+
+@pytest.mark.integration
+class TestOCITokenManagerCaching:
+    """Test token caching in OCITokenManager."""
+
+    def test_get_token_reuses_in_memory_token(self, mock_run: Any, tmp_path) -> None:
+        """Test repeat lookups are served from memory until invalidated."""
+        cache_file = tmp_path / "token"
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout='{"token": "fresh_token"}', stderr=""
+        )
+        token_manager = OCITokenManager("test/repo", cache_path=str(cache_file))
+
+        assert token_manager.get_token() == "fresh_token"
+        cache_file.unlink()  # Second lookup must not need the cache file
+        assert token_manager.get_token() == "fresh_token"
+        assert mock_run.call_count == 1
+
+        token_manager.invalidate_cache()
+        token_manager.get_token()
+
+        assert mock_run.call_count == 2
+
+    def test_get_token_writes_cache_file_atomically(
+        self, mock_run: Any, tmp_path
+    ) -> None:
+        """Test a fetched token is cached via rename, leaving no temp file."""
+        cache_file = tmp_path / "token"
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout='{"token": "fresh_token"}', stderr=""
+        )
+        token_manager = OCITokenManager("test/repo", cache_path=str(cache_file))
+
+        assert token_manager.get_token() == "fresh_token"
+        assert cache_file.read_text() == "fresh_token"
+        assert [p.name for p in tmp_path.iterdir()] == ["token"]
+
+    def test_get_token_removes_temp_file_when_rename_fails(
+        self, mocker: MockerFixture, mock_run: Any, tmp_path
+    ) -> None:
+        """Test a failed cache rename leaves no temp copy of the token behind."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout='{"token": "fresh_token"}', stderr=""
+        )
+        mocker.patch("os.replace", side_effect=PermissionError("not owner"))
+        token_manager = OCITokenManager("test/repo", cache_path=str(tmp_path / "token"))
+
+        assert token_manager.get_token() == "fresh_token"
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.integration
+class TestOCITokenManagerLinkHeader:
+    """Test Link header parsing in OCITokenManager."""
+
+    @pytest.mark.parametrize(
+        "link_header,expected",
+        [
+            (
+                '</v2/test/repo/tags/list?last=1.0&n=200>; rel="next"',
+                "/v2/test/repo/tags/list?last=1.0&n=200",
+            ),
+            (
+                "< /v2/test/repo/tags/list?last=2.0 > ; rel = 'next'",
+                "/v2/test/repo/tags/list?last=2.0",
+            ),
+            ('</v2/test/repo/tags/list?last=1.0>; rel="prev"', None),
+            (
+                (
+                    '</v2/test/repo/tags/list?last=1.0>; rel="prev", '
+                    '</v2/test/repo/tags/list?last=3.0>; rel="next"'
+                ),
+                "/v2/test/repo/tags/list?last=3.0",
+            ),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_parse_link_header(
+        self, link_header: Optional[str], expected: Optional[str]
+    ) -> None:
+        """Test the next URL is extracted from Link header variants."""
+        token_manager = OCITokenManager("test/repo")
+
+        assert token_manager.parse_link_header(link_header) == expected
+
+
+@pytest.mark.integration
+class TestGetClient:
+    """Test the per-repository OCIClient cache behind get_client."""
+
+    def test_get_client_shares_client_per_repository(self) -> None:
+        """Test get_client reuses one client, and its token, per repository."""
+        client = get_client("test/repo")
+
+        assert get_client("test/repo") is client
+        assert get_client("test/other") is not client